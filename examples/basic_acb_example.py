@@ -17,43 +17,38 @@ def main():
     print("ACB v2.0 Basic Example")
     print("=" * 25)
     
-    # Create interface and actuator
-    usb_interface = USBInterface(port, baudrate)
-    actuator = ACBv2(usb_interface)
-    
     try:
-        # Connect
+        # Connect; the actuator is disconnected when the block exits
         print(f"Connecting to {port}...")
-        if not actuator.connect():
-            print("❌ Connection failed!")
-            return 1
-        print("✅ Connected!")
-        
-        # Recalibrate sensors
-        print("Recalibrating sensors...")
-        if not actuator.recalibrate_sensors():
-            print("❌ Recalibration failed!")
-            return 1
-        print("✅ Recalibration complete!")
-        
-        time.sleep(2.0)
-        # Set velocity to 1000
-        print("Setting velocity to 1000°/s...")
-        actuator.enable()
-        if not actuator.set_velocity(1000.0):
-            print("❌ Failed to set velocity!")
-            return 1
-        print("✅ Velocity set to 1000°/s!")
-        
-        print("✅ Example completed successfully!")
+        with ACBv2(USBInterface(port, baudrate)) as actuator:
+            if not actuator.connected:
+                print("❌ Connection failed!")
+                return 1
+            print("✅ Connected!")
+            
+            # Recalibrate sensors
+            print("Recalibrating sensors...")
+            if not actuator.recalibrate_sensors():
+                print("❌ Recalibration failed!")
+                return 1
+            print("✅ Recalibration complete!")
+            
+            time.sleep(2.0)
+            # Set velocity to 1000
+            print("Setting velocity to 1000°/s...")
+            actuator.enable()
+            if not actuator.set_velocity(1000.0):
+                print("❌ Failed to set velocity!")
+                return 1
+            print("✅ Velocity set to 1000°/s!")
+            
+            print("✅ Example completed successfully!")
         
     except Exception as e:
         print(f"❌ Error: {e}")
         return 1
         
     finally:
-        # Clean up
-        actuator.disconnect()
         print("Disconnected.")
     
     return 0
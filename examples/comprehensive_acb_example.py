@@ -8,33 +8,25 @@ This example demonstrates:
 - Sensor recalibration with user confirmation
 - Velocity control with monitoring
 - Clean shutdown
+- Non-blocking monitoring with asyncio
 """
 
 import sys
 import time
+import asyncio
 import argparse
-from src.open_actuator import ACBv2, USBInterface, CommandMode
+from open_actuator import AsyncACBv2, USBInterface, CommandMode
 
 
-def main():
+# Map mode strings to CommandMode enum
+_MODE_MAP = {
+    "human": CommandMode.HUMAN_READABLE,
+    "binary": CommandMode.HIGH_SPEED_BINARY,
+    "simplefoc": CommandMode.SIMPLEFOC
+}
+
+async def main(args: argparse.Namespace):
     """Comprehensive example with command-line arguments."""
-    # Parse command line arguments
-    parser = argparse.ArgumentParser(description="ACB v2.0 Comprehensive Example")
-    parser.add_argument("port", nargs="?", default="/dev/ttyUSB0", 
-                       help="Serial port (default: /dev/ttyUSB0)")
-    parser.add_argument("baudrate", nargs="?", type=int, default=2000000,
-                       help="Baud rate (default: 2000000)")
-    parser.add_argument("--mode", choices=["human", "binary", "simplefoc"], 
-                       default="human", help="Communication mode (default: human)")
-    
-    args = parser.parse_args()
-    
-    # Map mode strings to CommandMode enum
-    mode_map = {
-        "human": CommandMode.HUMAN_READABLE,
-        "binary": CommandMode.HIGH_SPEED_BINARY,
-        "simplefoc": CommandMode.SIMPLEFOC
-    }
     
     print("ACB v2.0 Comprehensive Example")
     print("=" * 40)
@@ -43,17 +35,17 @@ def main():
     print(f"Mode: {args.mode}")
     print()
     
-    # Create USB interface and ACB v2 actuator
-    usb_interface = USBInterface(args.port, args.baudrate)
-    actuator = ACBv2(usb_interface)
-    
-    # Set communication mode
-    actuator.interface.command_mode = mode_map[args.mode]
+    # Create USB interface and ACB v2 actuator; the communication mode is
+    # negotiated with the actuator on connect
+    usb_interface = USBInterface(args.port, args.baudrate, mode=_MODE_MAP[args.mode])
+    actuator = AsyncACBv2(usb_interface)
+    # Set once the motor may be moving, so every exit path stops it
+    moving = False
     
     try:
         # Connect
         print("Connecting to actuator...")
-        if not actuator.connect():
+        if not await actuator.connect():
             print("❌ Failed to connect to actuator")
             print("Please check:")
             print("  - Port is correct and device is connected")
@@ -64,8 +56,8 @@ def main():
         
         # Get initial state
         print("\nGetting initial state...")
-        position = actuator.get_position()
-        velocity = actuator.get_velocity()
+        position = await actuator.get_position()
+        velocity = await actuator.get_velocity()
         print(f"Initial Position: {position:.2f}°" if position is not None else "Position: N/A")
         print(f"Initial Velocity: {velocity:.2f}°/s" if velocity is not None else "Velocity: N/A")
         
@@ -73,72 +65,109 @@ def main():
         print("\n⚠️  WARNING: Recalibration will disable the motor!")
         print("   Make sure the actuator is in a safe position!")
         
-        response = input("Continue with recalibration? (y/N): ").strip().lower()
+        loop = asyncio.get_running_loop()
+        response = await loop.run_in_executor(
+            None, input, "Continue with recalibration? (y/N): ")
+        response = response.strip().lower()
         if response != 'y':
             print("Recalibration cancelled by user")
             return 0
         
         print("Starting sensor recalibration...")
-        if not actuator.recalibrate_sensors():
+        if not await actuator.recalibrate_sensors():
             print("❌ Sensor recalibration failed!")
             return 1
         print("✅ Recalibration completed successfully!")
         
         # Set velocity to 1000
         print("\nSetting velocity to 1000°/s...")
-        if not actuator.set_velocity(1000.0):
+        moving = True
+        if not await actuator.set_velocity(1000.0):
             print("❌ Failed to set velocity!")
             return 1
         print("✅ Velocity set to 1000°/s!")
         
         # Monitor for a few seconds
         print("\nMonitoring for 3 seconds...")
-        start_time = time.time()
+        latest = {"position": None, "velocity": None}
+
+        async def poll(name, getter):
+            while True:
+                value = await getter()
+                if value is not None:
+                    latest[name] = value
+                await asyncio.sleep(0.1)
+
+        pollers = [
+            asyncio.create_task(poll("position", actuator.get_position)),
+            asyncio.create_task(poll("velocity", actuator.get_velocity)),
+        ]
+        deadline = time.monotonic_ns() + 3_000_000_000
         try:
-            while time.time() - start_time < 3.0:
-                position = actuator.get_position()
-                velocity = actuator.get_velocity()
-                print(f"\rPosition: {position:.2f}° | Velocity: {velocity:.2f}°/s", 
+            while time.monotonic_ns() < deadline:
+                await asyncio.sleep(0.1)
+                if latest["position"] is None or latest["velocity"] is None:
+                    continue
+                print(f"\rPosition: {latest['position']:.2f}° | Velocity: {latest['velocity']:.2f}°/s", 
                       end="", flush=True)
-                time.sleep(0.1)
-        except KeyboardInterrupt:
+        except (KeyboardInterrupt, asyncio.CancelledError):
+            # Under asyncio.run() Ctrl-C usually arrives as a cancellation;
+            # let it through so the motor is stopped below
             print("\nMonitoring stopped by user")
+            raise
+        finally:
+            for task in pollers:
+                task.cancel()
+            await asyncio.gather(*pollers, return_exceptions=True)
         
         print()  # New line
         
         # Stop the actuator
         print("\nStopping actuator...")
-        if actuator.stop():
+        if await actuator.stop():
+            moving = False
             print("✅ Actuator stopped")
         else:
             print("❌ Failed to stop actuator")
         
         # Get final state
         print("\nFinal state:")
-        position = actuator.get_position()
-        velocity = actuator.get_velocity()
+        position = await actuator.get_position()
+        velocity = await actuator.get_velocity()
         print(f"Final Position: {position:.2f}°" if position is not None else "Position: N/A")
         print(f"Final Velocity: {velocity:.2f}°/s" if velocity is not None else "Velocity: N/A")
         
         print("\n✅ Example completed successfully!")
         
-    except KeyboardInterrupt:
+    except (KeyboardInterrupt, asyncio.CancelledError):
         print("\n⚠️  Example interrupted by user")
-        print("Stopping actuator...")
-        actuator.stop()
         
     except Exception as e:
         print(f"\n❌ Error during execution: {e}")
         return 1
         
     finally:
+        # Never leave the motor running, however the example ended
+        if moving:
+            print("Stopping actuator...")
+            await actuator.stop()
+        
         # Always disconnect
         print("\nDisconnecting from actuator...")
-        actuator.disconnect()
+        await actuator.disconnect()
         print("✅ Disconnected")
     
     return 0
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    # Command line arguments; built only when run as a script, so importing
+    # the example (e.g. as a CI smoke test) does no argparse work
+    _PARSER = argparse.ArgumentParser(description="ACB v2.0 Comprehensive Example")
+    _PARSER.add_argument("port", nargs="?", default="/dev/ttyUSB0", 
+                        help="Serial port (default: /dev/ttyUSB0)")
+    _PARSER.add_argument("baudrate", nargs="?", type=int, default=2000000,
+                        help="Baud rate (default: 2000000)")
+    _PARSER.add_argument("--mode", choices=list(_MODE_MAP), 
+                        default="human", help="Communication mode (default: human)")
+    sys.exit(asyncio.run(main(_PARSER.parse_args())))
@@ -5,7 +5,8 @@ Basic ACB v2.0 example: Connect, recalibrate, and set velocity to 1000.
 
 import sys
 import time
-from open_actuator import ACBv2, USBInterface
+import numpy as np
+from open_actuator import ACBv2, get_interface
 from tqdm import tqdm
 
 target_velocity = 500.0
@@ -21,7 +22,7 @@ def main():
     print("=" * 25)
     
     # Create interface and actuator
-    usb_interface = USBInterface(port, baudrate)
+    usb_interface = get_interface(port, baudrate)
     actuator = ACBv2(usb_interface)
     
     try:
@@ -32,15 +33,12 @@ def main():
             return 1
         print("✅ Connected!")
         
-        # Set pole pairs to 7
-        if not actuator.set_pole_pairs(7):
-            print("❌ Failed to set pole pairs!")
+        # Set pole pairs to 7 and open up the angle limits
+        if not actuator.configure(pole_pairs=7, min_angle=-500000, max_angle=500000):
+            print("❌ Failed to configure pole pairs and angle limits!")
             return 1
         print("✅ Pole pairs set to 7!")
 
-
-        actuator.set_min_angle(-500000)
-        actuator.set_max_angle(500000)
         # Recalibrate sensors
         print("Recalibrating sensors...")
         if not actuator.recalibrate_sensors():
@@ -58,16 +56,19 @@ def main():
         # actuator.enable()
 
         print("Checking stability...")
-        velocities = []
-        positions = []
-        for _ in tqdm(range(20), desc="Checking stability"):
-            velocities.append(actuator.get_velocity())
-            positions.append(actuator.get_position())
+        velocities = np.empty(20, dtype=np.float64)
+        positions = np.empty(20, dtype=np.float64)
+        for i in tqdm(range(20), desc="Checking stability", mininterval=0.5):
+            state = actuator.get_state()
+            if state is None:
+                print("❌ Failed to read actuator state!")
+                return 1
+            positions[i], velocities[i] = state
             time.sleep(0.05)
-        avg_vel = sum(velocities) / len(velocities)
-        avg_pos = sum(positions) / len(positions)
-        vel_range = max(velocities) - min(velocities)
-        pos_range = max(positions) - min(positions)
+        avg_vel = velocities.mean()
+        avg_pos = positions.mean()
+        vel_range = np.ptp(velocities)
+        pos_range = np.ptp(positions)
 
         if abs(vel_range) > 1 or abs(pos_range) > 1:
             print(f"❌ Position or velocity is unstable! Δpos={pos_range}, Δvel={vel_range}")
@@ -83,15 +84,21 @@ def main():
         print(f"✅ Velocity set to {target_velocity}°/s!")
         
         print("Waiting for velocity to stabilize...")
-        for _ in tqdm(range(20), desc="Stabilizing"):
-            time.sleep(0.1)
+        if not actuator.wait_for_velocity(target_velocity,
+                                          tolerance=target_velocity * velocity_tolerance,
+                                          timeout=5.0):
+            print("❌ Velocity did not stabilize!")
+            return 1
 
-        velocities = []
-        for _ in tqdm(range(10), desc="Collecting velocity samples"):
+        velocities = np.empty(10, dtype=np.float64)
+        for i in tqdm(range(10), desc="Collecting velocity samples", mininterval=0.5):
             vel = actuator.get_velocity()
-            velocities.append(vel)
+            if vel is None:
+                print("❌ Failed to read velocity!")
+                return 1
+            velocities[i] = vel
             time.sleep(0.1)
-        avg_velocity = sum(velocities) / len(velocities)
+        avg_velocity = velocities.mean()
         print(f"Average Velocity (10 samples): {avg_velocity}°/s")
 
         if avg_velocity < target_velocity * (1 - velocity_tolerance) or avg_velocity > target_velocity * (1 + velocity_tolerance):
@@ -3,16 +3,12 @@
 Debug launcher script for the Open Actuator GUI.
 
 This script provides enhanced logging and debugging capabilities
-for troubleshooting communication issues.
+for troubleshooting communication issues. The package must be
+installed (e.g. ``pip install -e .``).
 """
 
-import sys
-import os
 import logging
 
-# Add the src directory to the Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
-
 # Set up logging
 logging.basicConfig(
     level=logging.DEBUG,
@@ -12,15 +12,19 @@ import shutil
 from pathlib import Path
 
 
-def run_command(command: str, check: bool = True) -> subprocess.CompletedProcess:
-    """Run a shell command and return the result."""
+def run_command(command: str, check: bool = True, capture: bool = False) -> subprocess.CompletedProcess:
+    """Run a shell command and return the result.
+
+    Output is streamed to the console unless ``capture`` is set.
+    """
     print(f"Running: {command}")
-    result = subprocess.run(command, shell=True, capture_output=True, text=True)
+    result = subprocess.run(command, shell=True, capture_output=capture, text=True)
     
     if check and result.returncode != 0:
         print(f"Error running command: {command}")
-        print(f"STDOUT: {result.stdout}")
-        print(f"STDERR: {result.stderr}")
+        if capture:
+            print(f"STDOUT: {result.stdout}")
+            print(f"STDERR: {result.stderr}")
         sys.exit(1)
     
     return result
@@ -29,10 +33,14 @@ def run_command(command: str, check: bool = True) -> subprocess.CompletedProcess
 def clean_build():
     """Clean build artifacts."""
     print("Cleaning build artifacts...")
-    dirs_to_clean = ['build', 'dist', '*.egg-info']
-    for pattern in dirs_to_clean:
-        for path in Path('.').glob(pattern):
-            if path.is_dir():
+    # egg-info is written next to the package sources (src/) with this layout
+    for base in (Path('.'), Path('src')):
+        if not base.is_dir():
+            continue
+        for path in base.iterdir():
+            is_artifact = path.name.endswith('.egg-info') or (
+                base == Path('.') and path.name in ('build', 'dist'))
+            if is_artifact and path.is_dir():
                 shutil.rmtree(path)
                 print(f"Removed {path}")
 
@@ -76,7 +84,7 @@ def install_from_pypi():
 def test_installation():
     """Test the installation."""
     print("Testing installation...")
-    result = run_command("open-actuator-gui --help", check=False)
+    result = run_command("open-actuator-gui --help", check=False, capture=True)
     if result.returncode == 0:
         print("✅ Installation test passed!")
     else:
@@ -4,8 +4,8 @@ Open Actuator - A control software for actuators with GUI interface.
 
 __version__ = "0.1.0"
 
-from .actuators import ACBv2, Actuator
-from .interface import USBInterface, Interface, CommandMode
+from .actuators import ACBv2, AsyncACBv2, Actuator, ActuatorFleet, call_many, get_full_state_many
+from .interface import USBInterface, Interface, CommandMode, ActuatorState, get_interface
 
-__all__ = ['ACBv2', 'Actuator', 'USBInterface', 'Interface', 'CommandMode']
+__all__ = ['ACBv2', 'AsyncACBv2', 'Actuator', 'ActuatorFleet', 'call_many', 'get_full_state_many', 'USBInterface', 'Interface', 'CommandMode', 'ActuatorState', 'get_interface']
 
@@ -0,0 +1,124 @@
+"""
+Short-lived caching of actuator readings.
+
+Telemetry getters are often called back-to-back (e.g. position then
+velocity for the same display update). Caching a reading for a few
+milliseconds lets the second caller reuse it instead of paying another
+USB round-trip. Concurrent threads asking for the same reading share a
+single in-flight request.
+"""
+
+import time
+import functools
+import threading
+from typing import Any, Callable
+
+
+def ttl_cache(ttl_ms: float = 20.0) -> Callable:
+    """
+    Cache a getter's non-None result per instance for ``ttl_ms`` milliseconds.
+
+    The instance must provide ``_ttl_cache`` (a dict) and ``_cache_generation``
+    (an int). Results are discarded when the generation changes, so a value read
+    while a command was being sent is never served after that command.
+
+    Args:
+        ttl_ms: Time-to-live of a cached value in milliseconds
+    """
+    ttl_ns = int(ttl_ms * 1_000_000)
+
+    def decorator(func: Callable) -> Callable:
+        key = func.__name__
+
+        @functools.wraps(func)
+        def wrapper(self, *args):
+            now = time.monotonic_ns()
+            generation = self._cache_generation
+            entry = self._ttl_cache.get((key, args))
+            if entry is not None and entry[0] == generation and now < entry[1]:
+                return entry[2]
+
+            value = func(self, *args)
+            if value is not None and generation == self._cache_generation:
+                self._ttl_cache[(key, args)] = (generation, now + ttl_ns, value)
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+def cached_result(instance: Any, name: str, *args) -> Any:
+    """
+    Get a still-valid result cached by a ``ttl_cache`` getter without calling it.
+
+    Args:
+        instance: Instance the getter caches on
+        name: Name of the getter
+        *args: Arguments the getter was called with
+
+    Returns:
+        The cached value, or None if there is none or it has expired
+    """
+    entry = instance._ttl_cache.get((name, args))
+    if (entry is not None and entry[0] == instance._cache_generation
+            and time.monotonic_ns() < entry[1]):
+        return entry[2]
+    return None
+
+
+def invalidates_cache(func: Callable) -> Callable:
+    """Drop all cached readings of the instance before running a command."""
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        self._cache_generation += 1
+        self._ttl_cache.clear()
+        return func(self, *args, **kwargs)
+
+    return wrapper
+
+
+class _Call:
+    """An in-flight getter call that other threads can wait on."""
+
+    __slots__ = ('done', 'value')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value: Any = None
+
+
+def single_flight(func: Callable) -> Callable:
+    """
+    Share one in-flight call between threads requesting the same reading.
+
+    A thread calling the getter while another thread is already running it
+    with the same arguments waits for that call and receives its result
+    instead of issuing a second USB transaction. The instance must provide
+    ``_inflight`` (a dict) and ``_inflight_lock`` (a lock).
+    """
+    key = func.__name__
+
+    @functools.wraps(func)
+    def wrapper(self, *args):
+        call_key = (key, args)
+        with self._inflight_lock:
+            call = self._inflight.get(call_key)
+            owner = call is None
+            if owner:
+                call = self._inflight[call_key] = _Call()
+
+        if not owner:
+            call.done.wait()
+            return call.value
+
+        try:
+            call.value = func(self, *args)
+        finally:
+            with self._inflight_lock:
+                del self._inflight[call_key]
+            call.done.set()
+        return call.value
+
+    return wrapper
@@ -1,6 +1,25 @@
-from typing import Optional, Tuple, Dict
+import time
+import threading
+import functools
+from operator import attrgetter
+import numpy as np
+from typing import Any, Optional, Tuple, Dict, Callable, ContextManager, Sequence
 from open_actuator.actuators.Actuator import Actuator
-from open_actuator.interface import USBInterface, TorqueControlType, FOCModulationType
+from open_actuator.interface import USBInterface, ActuatorState, CommandMode, TorqueControlType, FOCModulationType, CalibrationHandle
+from open_actuator._cache import ttl_cache, invalidates_cache, single_flight, cached_result
+
+# Row of each control loop in the PID gain table
+_PID_ROWS = {"velocity": 0, "angle": 1, "current": 2}
+
+# Slot caching each telemetry value that has a cached-value property
+_STATE_SLOTS = {
+    'position': '_position',
+    'velocity': '_velocity',
+    'torque': '_torque',
+    'temperature': '_temperature',
+    'bus_voltage': '_bus_voltage',
+    'internal_temperature': '_internal_temperature',
+}
 
 
 class ACBv2(Actuator):
@@ -11,6 +30,24 @@ class ACBv2(Actuator):
     with state management and all required control methods.
     """
     
+    __slots__ = (
+        '_position', '_velocity', '_torque', '_temperature', '_bus_voltage',
+        '_internal_temperature', '_enabled_event',
+        '_pid',
+        '_pole_pairs', '_downsample', '_min_angle', '_max_angle',
+        '_torque_controller', '_foc_modulation',
+        '_write_versions', '_write_lock',
+        '_ttl_cache', '_cache_generation', '_inflight', '_inflight_lock',
+    )
+    # Telemetry slots stay unset until the first reading; the properties
+    # report an unset slot as None
+    _position: float
+    _velocity: float
+    _torque: float
+    _temperature: float
+    _bus_voltage: float
+    _internal_temperature: float
+    
     def __init__(self, interface: USBInterface):
         """
         Initialize ACB v2.0 actuator.
@@ -21,26 +58,154 @@ class ACBv2(Actuator):
         super().__init__(interface)
         
         # Current actuator state
-        self._position: Optional[float] = None
-        self._velocity: Optional[float] = None
-        self._torque: Optional[float] = None
-        self._temperature: Optional[float] = None
-        self._bus_voltage: Optional[float] = None
-        self._internal_temperature: Optional[float] = None
-        self._enabled: bool = False
-        
-        # PID parameters
-        self._velocity_pid: Optional[Tuple[float, float, float]] = None
-        self._angle_pid: Optional[Tuple[float, float, float]] = None
-        self._current_pid: Optional[Tuple[float, float, float]] = None
-        
-        # Configuration
+        # Set while the actuator is enabled, so other threads can wait for it
+        self._enabled_event = threading.Event()
+        
+        # PID gains, one (P, I, D) row per control loop; NaN until known
+        self._pid = np.full((3, 3), np.nan)
+        
+        # Configuration (memoized: only changed through this object's setters)
+        self._pole_pairs: Optional[int] = None
         self._downsample: Optional[int] = None
         self._min_angle: Optional[float] = None
         self._max_angle: Optional[float] = None
         self._torque_controller: Optional[TorqueControlType] = None
         self._foc_modulation: Optional[FOCModulationType] = None
+        # Number of writes started per setting, so late results never clobber newer ones
+        self._write_versions: Dict[str, int] = {}
+        # Guards the version bump and the check-and-store across setter threads
+        self._write_lock = threading.Lock()
+
+        # Short-lived cache for telemetry reads
+        self._ttl_cache: Dict[tuple, tuple] = {}
+        self._cache_generation: int = 0
+        
+        # Telemetry reads currently in progress, shared between threads
+        self._inflight: Dict[tuple, object] = {}
+        self._inflight_lock = threading.Lock()
+
+    def connect(self) -> bool:
+        """
+        Connect to the actuator.
+        
+        Returns:
+            True if connection successful, False otherwise
+        """
+        # The device may have been reconfigured while we were away
+        self.invalidate_config_cache()
+        return super().connect()
 
+    def _read_field(self, field: str, read: Callable[[], Any], memoize: bool = False) -> Any:
+        """
+        Read a value from the actuator and keep it in a state field.
+        
+        Args:
+            field: Name of the attribute holding the cached value
+            read: Interface getter
+            memoize: Return the cached value without a round-trip when one is set
+            
+        Returns:
+            The value or None if failed
+        """
+        if memoize:
+            value = getattr(self, field)
+            if value is not None:
+                return value
+        value = read()
+        if value is not None:
+            setattr(self, field, value)
+        return value
+
+    def _write_field(self, field: str, send: Callable[[], bool], value: Any) -> bool:
+        """
+        Send a setting and record it in a state field once the actuator accepted it.
+        
+        Args:
+            field: Name of the attribute holding the cached value
+            send: Interface setter call
+            value: Value that is sent
+            
+        Returns:
+            The setter result
+        """
+        return self._write_fields(send, {field: value})
+
+    def _write_fields(self, send: Callable[[], bool], values: Dict[str, Any],
+                      store: Optional[Callable[[str, Any], None]] = None) -> bool:
+        """
+        Send settings and record them once the actuator accepted them.
+        
+        While the command is in flight the settings read as unknown, so a
+        memoized getter on another thread asks the actuator instead of
+        returning the old value. A write that finishes after a newer write
+        to the same setting leaves the newer result alone, and a failed
+        write leaves the setting unknown.
+        
+        Args:
+            send: Interface setter call
+            values: New value of each setting, by name
+            store: Records a setting (defaults to setting the attribute)
+            
+        Returns:
+            The setter result
+        """
+        if store is None:
+            store = functools.partial(setattr, self)
+        versions = self._write_versions
+        started = {}
+        with self._write_lock:
+            for name in values:
+                started[name] = versions[name] = versions.get(name, 0) + 1
+                store(name, None)
+        success = send()
+        with self._write_lock:
+            for name, value in values.items():
+                if versions[name] == started[name]:
+                    store(name, value if success else None)
+        return success
+
+    def _store_pid(self, loop: str, gains: Optional[Tuple[float, float, float]]) -> None:
+        """Record a loop's PID gains, or mark them unknown with None."""
+        self._pid[_PID_ROWS[loop]] = np.nan if gains is None else gains
+
+    def _read_pid(self, loop: str, read: Callable[[], Optional[Tuple[float, float, float]]]) -> Optional[Tuple[float, float, float]]:
+        """
+        Return a loop's PID gains, querying the actuator only if they are unknown.
+        
+        Args:
+            loop: Control loop name ("velocity", "angle" or "current")
+            read: Interface getter
+            
+        Returns:
+            Tuple of (P, I, D) values or None if failed
+        """
+        row = self._pid[_PID_ROWS[loop]]
+        if not np.isnan(row[0]):
+            return tuple(row.tolist())
+        gains = read()
+        if gains is not None:
+            row[:] = gains
+        return gains
+
+    def _cached_pid(self, loop: str) -> Optional[Tuple[float, float, float]]:
+        """Return a loop's known PID gains without querying the actuator."""
+        row = self._pid[_PID_ROWS[loop]]
+        if np.isnan(row[0]):
+            return None
+        return tuple(row.tolist())
+
+    def invalidate_config_cache(self) -> None:
+        """Forget memoized configuration so the next reads query the actuator."""
+        self._pole_pairs = None
+        self._downsample = None
+        self._min_angle = None
+        self._max_angle = None
+        self._torque_controller = None
+        self._foc_modulation = None
+        self._pid.fill(np.nan)
+
+    @ttl_cache(ttl_ms=20)
+    @single_flight
     def get_position(self) -> Optional[float]:
         """
         Get current actuator position.
@@ -48,11 +213,10 @@ class ACBv2(Actuator):
         Returns:
             Current position in degrees or None if failed
         """
-        position = self.interface.get_position()
-        if position is not None:
-            self._position = position
-        return position
+        return self._read_state_field('position', self.interface.get_position)
 
+    @ttl_cache(ttl_ms=20)
+    @single_flight
     def get_velocity(self) -> Optional[float]:
         """
         Get current actuator velocity.
@@ -60,11 +224,9 @@ class ACBv2(Actuator):
         Returns:
             Current velocity in degrees/second or None if failed
         """
-        velocity = self.interface.get_velocity()
-        if velocity is not None:
-            self._velocity = velocity
-        return velocity
+        return self._read_state_field('velocity', self.interface.get_velocity)
 
+    @single_flight
     def get_torque(self) -> Optional[float]:
         """
         Get current actuator torque.
@@ -72,11 +234,9 @@ class ACBv2(Actuator):
         Returns:
             Current torque in Nm or None if failed
         """
-        torque = self.interface.get_torque()
-        if torque is not None:
-            self._torque = torque
-        return torque
+        return self._read_state_field('torque', self.interface.get_torque)
 
+    @invalidates_cache
     def set_position(self, position: float) -> bool:
         """
         Set actuator position.
@@ -89,6 +249,7 @@ class ACBv2(Actuator):
         """
         return self.interface.set_position(position)
 
+    @invalidates_cache
     def set_velocity(self, velocity: float) -> bool:
         """
         Set actuator velocity.
@@ -101,6 +262,7 @@ class ACBv2(Actuator):
         """
         return self.interface.set_velocity(velocity)
 
+    @invalidates_cache
     def set_torque(self, torque: float) -> bool:
         """
         Set actuator torque.
@@ -113,6 +275,93 @@ class ACBv2(Actuator):
         """
         return self.interface.set_torque(torque)
 
+    @invalidates_cache
+    def set_position_nowait(self, position: float) -> bool:
+        """
+        Send a position setpoint without waiting for its acknowledgement.
+        
+        Call flush() once a burst of setpoints has been sent.
+        
+        Args:
+            position: Target position in degrees
+            
+        Returns:
+            True if the setpoint was sent
+        """
+        return self.interface.set_position_nowait(position)
+
+    def flush(self) -> bool:
+        """
+        Wait for every setpoint sent with set_position_nowait() to be acknowledged.
+        
+        Returns:
+            True if all setpoints were acknowledged
+        """
+        return self.interface.flush_acks()
+
+    def batched_commands(self) -> ContextManager[None]:
+        """
+        Send the setpoints issued inside a ``with`` block in as few USB writes as possible.
+        
+        Setters called inside the block return True once their command is
+        queued; acknowledgements are collected when the block exits.
+        
+        Example:
+            with actuator.batched_commands():
+                actuator.set_velocity_pid(1.0, 0.1, 0.0)
+                actuator.set_angle_pid(2.0, 0.0, 0.05)
+        """
+        return self.interface.batched_commands()
+
+    @invalidates_cache
+    def stream_trajectory(self, positions, period: float) -> bool:
+        """
+        Stream position setpoints at a fixed period (binary mode only).
+        
+        Args:
+            positions: Target positions in degrees (any array-like)
+            period: Time between setpoints in seconds
+            
+        Returns:
+            True if every setpoint was acknowledged
+        """
+        return self.interface.stream_trajectory(positions, period)
+
+    @invalidates_cache
+    def set_positions(self, positions: Sequence[float], dt_us: int) -> bool:
+        """
+        Play back a sequence of position setpoints at a fixed interval.
+        
+        In binary mode the whole trajectory is encoded at once and streamed
+        by stream_trajectory(). In human-readable mode the setpoints are
+        paced on the host and sent without waiting for each acknowledgement.
+        
+        Args:
+            positions: Target positions in degrees
+            dt_us: Interval between setpoints in microseconds
+            
+        Returns:
+            True if every setpoint was acknowledged
+        """
+        period = dt_us / 1e6
+        if self.interface.command_mode != CommandMode.HUMAN_READABLE:
+            return self.interface.stream_trajectory(positions, period)
+            
+        interface = self.interface
+        set_position_nowait = interface.set_position_nowait
+        monotonic = time.monotonic
+        next_send = monotonic()
+        for position in positions:
+            delay = next_send - monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            if not set_position_nowait(position):
+                interface.flush_acks()
+                return False
+            next_send += period
+        return interface.flush_acks()
+
+    @invalidates_cache
     def enable(self) -> bool:
         """
         Enable the actuator.
@@ -122,9 +371,10 @@ class ACBv2(Actuator):
         """
         success = self.interface.enable()
         if success:
-            self._enabled = True
+            self._enabled_event.set()
         return success
 
+    @invalidates_cache
     def disable(self) -> bool:
         """
         Disable the actuator.
@@ -134,9 +384,22 @@ class ACBv2(Actuator):
         """
         success = self.interface.disable()
         if success:
-            self._enabled = False
+            self._enabled_event.clear()
         return success
 
+    def wait_until_enabled(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the actuator has been enabled through this object.
+        
+        Args:
+            timeout: Maximum time to wait in seconds (None waits forever)
+            
+        Returns:
+            True if the actuator is enabled
+        """
+        return self._enabled_event.wait(timeout)
+
+    @invalidates_cache
     def home(self) -> bool:
         """
         Home the actuator.
@@ -146,6 +409,7 @@ class ACBv2(Actuator):
         """
         return self.interface.home()
 
+    @invalidates_cache
     def stop(self) -> bool:
         """
         Stop the actuator.
@@ -155,6 +419,7 @@ class ACBv2(Actuator):
         """
         return self.interface.stop()
 
+    @invalidates_cache
     def reset_position(self) -> bool:
         """
         Reset the actuator position to zero without changing the target.
@@ -165,6 +430,35 @@ class ACBv2(Actuator):
         """
         return self.interface.reset_position()
 
+    def wait_for_velocity(self, target: float, tolerance: float = 1.0, timeout: float = 5.0,
+                          consecutive: int = 3, poll_interval: float = 0.02) -> bool:
+        """
+        Wait until the measured velocity settles at a target.
+        
+        Args:
+            target: Target velocity in degrees/second
+            tolerance: Allowed deviation from the target in degrees/second
+            timeout: Maximum time to wait in seconds
+            consecutive: Number of consecutive in-tolerance samples required
+            poll_interval: Delay between samples in seconds
+            
+        Returns:
+            True if the velocity settled before the timeout
+        """
+        deadline = time.monotonic() + timeout
+        in_tolerance = 0
+        while time.monotonic() < deadline:
+            velocity = self.get_velocity()
+            if velocity is not None and abs(velocity - target) <= tolerance:
+                in_tolerance += 1
+                if in_tolerance >= consecutive:
+                    return True
+            else:
+                in_tolerance = 0
+            time.sleep(poll_interval)
+        return False
+
+    @single_flight
     def get_temperature(self) -> Optional[float]:
         """
         Get current board temperature.
@@ -172,11 +466,9 @@ class ACBv2(Actuator):
         Returns:
             Current temperature in Celsius or None if failed
         """
-        temperature = self.interface.get_temperature()
-        if temperature is not None:
-            self._temperature = temperature
-        return temperature
+        return self._read_state_field('temperature', self.interface.get_temperature)
 
+    @single_flight
     def get_bus_voltage(self) -> Optional[float]:
         """
         Get current bus voltage.
@@ -184,11 +476,9 @@ class ACBv2(Actuator):
         Returns:
             Current bus voltage in Volts or None if failed
         """
-        bus_voltage = self.interface.get_bus_voltage()
-        if bus_voltage is not None:
-            self._bus_voltage = bus_voltage
-        return bus_voltage
+        return self._read_state_field('bus_voltage', self.interface.get_bus_voltage)
 
+    @single_flight
     def get_internal_temperature(self) -> Optional[float]:
         """
         Get current internal STM32 temperature.
@@ -196,11 +486,9 @@ class ACBv2(Actuator):
         Returns:
             Current internal temperature in Celsius or None if failed
         """
-        internal_temperature = self.interface.get_internal_temperature()
-        if internal_temperature is not None:
-            self._internal_temperature = internal_temperature
-        return internal_temperature
+        return self._read_state_field('internal_temperature', self.interface.get_internal_temperature)
 
+    @single_flight
     def get_current_a(self) -> Optional[float]:
         """
         Get current phase A current.
@@ -208,8 +496,9 @@ class ACBv2(Actuator):
         Returns:
             Current phase A current in Amperes or None if failed
         """
-        return self.interface.get_current_a()
+        return self._read_state_field('current_a', self.interface.get_current_a)
 
+    @single_flight
     def get_current_b(self) -> Optional[float]:
         """
         Get current phase B current.
@@ -217,8 +506,9 @@ class ACBv2(Actuator):
         Returns:
             Current phase B current in Amperes or None if failed
         """
-        return self.interface.get_current_b()
+        return self._read_state_field('current_b', self.interface.get_current_b)
 
+    @single_flight
     def get_current_c(self) -> Optional[float]:
         """
         Get current phase C current.
@@ -226,7 +516,7 @@ class ACBv2(Actuator):
         Returns:
             Current phase C current in Amperes or None if failed
         """
-        return self.interface.get_current_c()
+        return self._read_state_field('current_c', self.interface.get_current_c)
 
     def get_velocity_pid(self) -> Optional[Tuple[float, float, float]]:
         """
@@ -235,10 +525,7 @@ class ACBv2(Actuator):
         Returns:
             Tuple of (P, I, D) values or None if failed
         """
-        pid_values = self.interface.get_velocity_pid()
-        if pid_values is not None:
-            self._velocity_pid = pid_values
-        return pid_values
+        return self._read_pid("velocity", self.interface.get_velocity_pid)
 
     def set_velocity_pid(self, p: float, i: float, d: float) -> bool:
         """
@@ -252,10 +539,8 @@ class ACBv2(Actuator):
         Returns:
             True if command sent successfully
         """
-        success = self.interface.set_velocity_pid(p, i, d)
-        if success:
-            self._velocity_pid = (p, i, d)
-        return success
+        return self._write_fields(lambda: self.interface.set_velocity_pid(p, i, d),
+                                  {"velocity": (p, i, d)}, self._store_pid)
 
     def get_angle_pid(self) -> Optional[Tuple[float, float, float]]:
         """
@@ -264,10 +549,7 @@ class ACBv2(Actuator):
         Returns:
             Tuple of (P, I, D) values or None if failed
         """
-        pid_values = self.interface.get_angle_pid()
-        if pid_values is not None:
-            self._angle_pid = pid_values
-        return pid_values
+        return self._read_pid("angle", self.interface.get_angle_pid)
 
     def set_angle_pid(self, p: float, i: float, d: float) -> bool:
         """
@@ -281,10 +563,8 @@ class ACBv2(Actuator):
         Returns:
             True if command sent successfully
         """
-        success = self.interface.set_angle_pid(p, i, d)
-        if success:
-            self._angle_pid = (p, i, d)
-        return success
+        return self._write_fields(lambda: self.interface.set_angle_pid(p, i, d),
+                                  {"angle": (p, i, d)}, self._store_pid)
 
     def get_current_pid(self) -> Optional[Tuple[float, float, float]]:
         """
@@ -293,10 +573,7 @@ class ACBv2(Actuator):
         Returns:
             Tuple of (P, I, D) values or None if failed
         """
-        pid_values = self.interface.get_current_pid()
-        if pid_values is not None:
-            self._current_pid = pid_values
-        return pid_values
+        return self._read_pid("current", self.interface.get_current_pid)
 
     def set_current_pid(self, p: float, i: float, d: float) -> bool:
         """
@@ -310,10 +587,44 @@ class ACBv2(Actuator):
         Returns:
             True if command sent successfully
         """
-        success = self.interface.set_current_pid(p, i, d)
-        if success:
-            self._current_pid = (p, i, d)
-        return success
+        return self._write_fields(lambda: self.interface.set_current_pid(p, i, d),
+                                  {"current": (p, i, d)}, self._store_pid)
+
+    def set_all_pids(self, gains) -> bool:
+        """
+        Set the velocity, angle and current PID gains in one USB transfer.
+        
+        Args:
+            gains: 3x3 array-like of (P, I, D) rows for the velocity, angle
+                and current loops
+            
+        Returns:
+            True if every loop accepted its gains
+            
+        Raises:
+            RuntimeError: If the interface is not in human-readable mode,
+                which is the only mode with PID commands
+        """
+        if self.interface.command_mode != CommandMode.HUMAN_READABLE:
+            raise RuntimeError("set_all_pids() needs human-readable mode; "
+                               "the binary protocol has no PID commands")
+        gains = np.asarray(gains, dtype=np.float64)
+        if gains.shape != (3, 3):
+            return False
+        rows = gains.tolist()
+        
+        def send() -> bool:
+            with self.interface.batched_commands():
+                results = [
+                    self.interface.set_velocity_pid(*rows[0]),
+                    self.interface.set_angle_pid(*rows[1]),
+                    self.interface.set_current_pid(*rows[2]),
+                ]
+                # Collect the acknowledgements here so failures are reported
+                acknowledged = self.interface.flush_acks()
+            return acknowledged and all(results)
+            
+        return self._write_fields(send, dict(zip(_PID_ROWS, rows)), self._store_pid)
 
     def save_config(self) -> bool:
         """
@@ -331,10 +642,7 @@ class ACBv2(Actuator):
         Returns:
             Current downsampling value or None if failed
         """
-        downsample = self.interface.get_downsample()
-        if downsample is not None:
-            self._downsample = downsample
-        return downsample
+        return self._read_field('_downsample', self.interface.get_downsample, memoize=True)
 
     def set_downsample(self, downsample: int) -> bool:
         """
@@ -346,12 +654,10 @@ class ACBv2(Actuator):
         Returns:
             True if command sent successfully
         """
-        success = self.interface.set_downsample(downsample)
-        if success:
-            self._downsample = downsample
-        return success
+        return self._write_field('_downsample', lambda: self.interface.set_downsample(downsample), downsample)
 
 
+    @invalidates_cache
     def recalibrate_sensors(self) -> bool:
         """
         Recalibrate the actuator sensors.
@@ -359,8 +665,20 @@ class ACBv2(Actuator):
         Returns:
             True if command sent successfully
         """
+        self.invalidate_config_cache()
         return self.interface.recalibrate_sensors()
 
+    @invalidates_cache
+    def begin_recalibrate_sensors(self) -> Optional[CalibrationHandle]:
+        """
+        Start a sensor recalibration and return without waiting for it.
+        
+        Returns:
+            Handle to poll() or wait() on, or None if it could not be started
+        """
+        self.invalidate_config_cache()
+        return self.interface.begin_recalibrate_sensors()
+
     def get_pole_pairs(self) -> Optional[int]:
         """
         Get current number of pole pairs.
@@ -368,8 +686,7 @@ class ACBv2(Actuator):
         Returns:
             Current number of pole pairs or None if failed
         """
-        pole_pairs = self.interface.get_pole_pairs()
-        return pole_pairs
+        return self._read_field('_pole_pairs', self.interface.get_pole_pairs, memoize=True)
 
     def set_pole_pairs(self, pole_pairs: int) -> bool:
         """
@@ -381,16 +698,135 @@ class ACBv2(Actuator):
         Returns:
             True if command sent successfully
         """
-        return self.interface.set_pole_pairs(pole_pairs)
+        return self._write_field('_pole_pairs', lambda: self.interface.set_pole_pairs(pole_pairs), pole_pairs)
+
+    def configure(self, pole_pairs: Optional[int] = None, min_angle: Optional[float] = None,
+                  max_angle: Optional[float] = None) -> bool:
+        """
+        Set pole pairs and angle limits in one batched exchange.
+        
+        Args:
+            pole_pairs: Number of pole pairs (1-50)
+            min_angle: Minimum angle in degrees
+            max_angle: Maximum angle in degrees
+            
+        Returns:
+            True if every command was acknowledged
+        """
+        values = {'_pole_pairs': pole_pairs, '_min_angle': min_angle, '_max_angle': max_angle}
+        return self._write_fields(lambda: self.interface.configure(pole_pairs, min_angle, max_angle),
+                                  {field: value for field, value in values.items() if value is not None})
 
-    def get_full_state(self) -> Optional[Dict[str, float]]:
+    def get_full_state(self) -> Optional[ActuatorState]:
         """
         Get full actuator state including position, velocity, torque, and status.
         
         Returns:
-            Dictionary with state data or None if failed
+            ActuatorState with state data or None if failed
+        """
+        return self._refresh_state()
+
+    @invalidates_cache
+    def refresh_state(self) -> Optional[ActuatorState]:
+        """
+        Read the full state now, once per control tick.
+        
+        Drops any cached readings first, so the telemetry getters called
+        right after this (get_position(), get_temperature(), ...) are all
+        served from this one round-trip instead of one each.
+        
+        Returns:
+            ActuatorState with state data or None if failed
+        """
+        return self._refresh_state()
+
+    @ttl_cache(ttl_ms=2)
+    @single_flight
+    def _refresh_state(self) -> Optional[ActuatorState]:
+        """
+        Read the full state once per tick and update every cached field.
+        
+        Telemetry getters called within the same couple of milliseconds are
+        served from this one round-trip.
+        
+        Returns:
+            ActuatorState with state data or None if failed
+        """
+        state = self.interface.get_full_state()
+        if state is not None:
+            self._position = state.position
+            self._velocity = state.velocity
+            self._torque = state.torque
+            self._temperature = state.temperature
+            self._bus_voltage = state.bus_voltage
+            self._internal_temperature = state.internal_temperature
+        return state
+
+    def _read_state_field(self, field: str, read: Callable[[], Optional[float]]) -> Optional[float]:
+        """
+        Get one telemetry value.
+        
+        A full state read by refresh_state() within its cache lifetime is
+        used as is; otherwise the value is a single query, so one getter
+        never pays for fields it does not return (use poll_state() or
+        refresh_state() to read several at once). A failed read is not
+        retried.
+        
+        Args:
+            field: Name of the value in ActuatorState
+            read: Individual interface getter
+            
+        Returns:
+            The value or None if failed
+        """
+        state = cached_result(self, '_refresh_state')
+        if state is not None:
+            return getattr(state, field)
+        value = read()
+        if value is not None and field in _STATE_SLOTS:
+            setattr(self, _STATE_SLOTS[field], value)
+        return value
+
+    def get_state(self) -> Optional[Tuple[float, float]]:
+        """
+        Get current position and velocity in a single round-trip.
+
+        Returns:
+            Tuple of (position, velocity) or None if failed
+        """
+        state = self.poll_state()
+        if state is None:
+            return None
+        return (state[0], state[1])
+
+    @single_flight
+    def poll_state(self) -> Optional[Tuple[float, float, float]]:
+        """
+        Get current position, velocity and torque in a single round-trip.
+
+        Returns:
+            Tuple of (position, velocity, torque) or None if failed
+        """
+        state = self.interface.poll_state()
+        if state is not None:
+            self._position, self._velocity, self._torque = state
+        return state
+
+    def poll_state_into(self, out: np.ndarray) -> bool:
+        """
+        Write current position, velocity and torque into an existing array.
+        
+        Meant for control loops that log into preallocated arrays; the
+        cached-value properties are not updated, so no Python floats are
+        created per reading.
+        
+        Args:
+            out: Float array of shape (3,) receiving (position, velocity, torque)
+            
+        Returns:
+            True if ``out`` was filled
         """
-        return self.interface.get_full_state()
+        return self.interface.poll_state_into(out)
 
     def get_min_angle(self) -> Optional[float]:
         """
@@ -399,10 +835,7 @@ class ACBv2(Actuator):
         Returns:
             Current minimum angle in degrees or None if failed
         """
-        min_angle = self.interface.get_min_angle()
-        if min_angle is not None:
-            self._min_angle = min_angle
-        return min_angle
+        return self._read_field('_min_angle', self.interface.get_min_angle, memoize=True)
 
     def set_min_angle(self, min_angle: float) -> bool:
         """
@@ -414,10 +847,7 @@ class ACBv2(Actuator):
         Returns:
             True if command sent successfully
         """
-        success = self.interface.set_min_angle(min_angle)
-        if success:
-            self._min_angle = min_angle
-        return success
+        return self._write_field('_min_angle', lambda: self.interface.set_min_angle(min_angle), min_angle)
 
     def get_max_angle(self) -> Optional[float]:
         """
@@ -426,10 +856,7 @@ class ACBv2(Actuator):
         Returns:
             Current maximum angle in degrees or None if failed
         """
-        max_angle = self.interface.get_max_angle()
-        if max_angle is not None:
-            self._max_angle = max_angle
-        return max_angle
+        return self._read_field('_max_angle', self.interface.get_max_angle, memoize=True)
 
     def set_max_angle(self, max_angle: float) -> bool:
         """
@@ -441,10 +868,7 @@ class ACBv2(Actuator):
         Returns:
             True if command sent successfully
         """
-        success = self.interface.set_max_angle(max_angle)
-        if success:
-            self._max_angle = max_angle
-        return success
+        return self._write_field('_max_angle', lambda: self.interface.set_max_angle(max_angle), max_angle)
 
     def get_torque_controller(self) -> Optional[TorqueControlType]:
         """
@@ -453,10 +877,7 @@ class ACBv2(Actuator):
         Returns:
             Current torque controller type or None if failed
         """
-        controller_type = self.interface.get_torque_controller()
-        if controller_type is not None:
-            self._torque_controller = controller_type
-        return controller_type
+        return self._read_field('_torque_controller', self.interface.get_torque_controller, memoize=True)
 
     def set_torque_controller(self, controller_type: TorqueControlType) -> bool:
         """
@@ -468,10 +889,7 @@ class ACBv2(Actuator):
         Returns:
             True if command sent successfully
         """
-        success = self.interface.set_torque_controller(controller_type)
-        if success:
-            self._torque_controller = controller_type
-        return success
+        return self._write_field('_torque_controller', lambda: self.interface.set_torque_controller(controller_type), controller_type)
 
     def get_foc_modulation(self) -> Optional[FOCModulationType]:
         """
@@ -480,10 +898,7 @@ class ACBv2(Actuator):
         Returns:
             Current FOC modulation type or None if failed
         """
-        modulation_type = self.interface.get_foc_modulation()
-        if modulation_type is not None:
-            self._foc_modulation = modulation_type
-        return modulation_type
+        return self._read_field('_foc_modulation', self.interface.get_foc_modulation, memoize=True)
 
     def set_foc_modulation(self, modulation_type: FOCModulationType) -> bool:
         """
@@ -495,83 +910,99 @@ class ACBv2(Actuator):
         Returns:
             True if command sent successfully
         """
-        success = self.interface.set_foc_modulation(modulation_type)
-        if success:
-            self._foc_modulation = modulation_type
-        return success
+        return self._write_field('_foc_modulation', lambda: self.interface.set_foc_modulation(modulation_type), modulation_type)
+
+    def __enter__(self) -> "ACBv2":
+        """Connect to the actuator when entering a ``with`` block."""
+        self.connect()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Disconnect from the actuator when leaving a ``with`` block."""
+        self.disconnect()
 
     # State access methods
+    @property
+    def connected(self) -> bool:
+        """Get interface connection state."""
+        return self.interface.connected
+
     @property
     def position(self) -> Optional[float]:
         """Get cached position value."""
-        return self._position
+        try:
+            return self._position
+        except AttributeError:
+            return None
 
     @property
     def velocity(self) -> Optional[float]:
         """Get cached velocity value."""
-        return self._velocity
+        try:
+            return self._velocity
+        except AttributeError:
+            return None
 
     @property
     def torque(self) -> Optional[float]:
         """Get cached torque value."""
-        return self._torque
+        try:
+            return self._torque
+        except AttributeError:
+            return None
 
     @property
     def temperature(self) -> Optional[float]:
         """Get cached temperature value."""
-        return self._temperature
+        try:
+            return self._temperature
+        except AttributeError:
+            return None
 
     @property
     def bus_voltage(self) -> Optional[float]:
         """Get cached bus voltage value."""
-        return self._bus_voltage
+        try:
+            return self._bus_voltage
+        except AttributeError:
+            return None
 
     @property
     def internal_temperature(self) -> Optional[float]:
         """Get cached internal temperature value."""
-        return self._internal_temperature
+        try:
+            return self._internal_temperature
+        except AttributeError:
+            return None
 
     @property
     def enabled(self) -> bool:
         """Get cached enabled state."""
-        return self._enabled
+        return self._enabled_event.is_set()
 
     @property
     def velocity_pid(self) -> Optional[Tuple[float, float, float]]:
         """Get cached velocity PID values."""
-        return self._velocity_pid
+        return self._cached_pid("velocity")
 
     @property
     def angle_pid(self) -> Optional[Tuple[float, float, float]]:
         """Get cached angle PID values."""
-        return self._angle_pid
+        return self._cached_pid("angle")
 
     @property
     def current_pid(self) -> Optional[Tuple[float, float, float]]:
         """Get cached current PID values."""
-        return self._current_pid
-
-    @property
-    def downsample(self) -> Optional[int]:
-        """Get cached downsample value."""
-        return self._downsample
-
-    @property
-    def min_angle(self) -> Optional[float]:
-        """Get cached minimum angle value."""
-        return self._min_angle
-
-    @property
-    def max_angle(self) -> Optional[float]:
-        """Get cached maximum angle value."""
-        return self._max_angle
-
-    @property
-    def torque_controller(self) -> Optional[TorqueControlType]:
-        """Get cached torque controller type."""
-        return self._torque_controller
+        return self._cached_pid("current")
 
     @property
-    def foc_modulation(self) -> Optional[FOCModulationType]:
-        """Get cached FOC modulation type."""
-        return self._foc_modulation
\ No newline at end of file
+    def pid_gains(self) -> np.ndarray:
+        """Get a copy of the cached PID gains (rows: velocity, angle, current; NaN if unknown)."""
+        return self._pid.copy()
+
+    # Plain slot reads: attrgetter runs the read in C, without a Python frame
+    downsample = property(attrgetter('_downsample'), doc="Get cached downsample value.")
+    min_angle = property(attrgetter('_min_angle'), doc="Get cached minimum angle value.")
+    max_angle = property(attrgetter('_max_angle'), doc="Get cached maximum angle value.")
+    torque_controller = property(attrgetter('_torque_controller'), doc="Get cached torque controller type.")
+    foc_modulation = property(attrgetter('_foc_modulation'), doc="Get cached FOC modulation type.")
\ No newline at end of file
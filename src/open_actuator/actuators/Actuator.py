@@ -1,11 +1,22 @@
+import asyncio
+import threading
+from typing import Any, Callable, Dict, Union
 from open_actuator.interface import Interface
+from open_actuator.command import (
+    Command, SetPositionCommand, SetVelocityCommand, SetTorqueCommand,
+    GetPositionCommand, GetVelocityCommand, GetTorqueCommand,
+    EnableCommand, DisableCommand, HomeCommand, StopCommand,
+)
 
 
 class Actuator:
+    __slots__ = ('interface', '_io_lock')
     interface: Interface
 
     def __init__(self, interface: Interface):
         self.interface = interface
+        # Held by the async wrappers so executor threads never share the port at once
+        self._io_lock = threading.Lock()
         ...
 
     def connect(self) -> bool:
@@ -14,8 +25,30 @@ class Actuator:
     def disconnect(self) -> bool:
         return self.interface.disconnect()
 
-    def send_command(self, command: str):
-        self.interface.send_command(command)
+    def send_command(self, command: Union[str, Command]) -> Any:
+        if isinstance(command, str):
+            return self.interface.send_command(command)
+        # One lookup on the exact command type instead of matching names
+        handler = _DISPATCH.get(type(command))
+        if handler is None:
+            handler = _handler_for(type(command))
+        return handler(self, command)
+
+    def _locked_call(self, func: Callable, *args) -> Any:
+        with self._io_lock:
+            return func(*args)
+
+    # Blocking USB calls run on the default executor so the event loop keeps going,
+    # one at a time so concurrent calls cannot interleave on the serial port
+    async def connect_async(self) -> bool:
+        return await asyncio.get_running_loop().run_in_executor(None, self._locked_call, self.connect)
+
+    async def disconnect_async(self) -> None:
+        await asyncio.get_running_loop().run_in_executor(None, self._locked_call, self.disconnect)
+
+    async def send_command_async(self, command: Union[str, Command]) -> Any:
+        return await asyncio.get_running_loop().run_in_executor(
+            None, self._locked_call, self.send_command, command)
 
     def get_position(self):
         raise NotImplementedError("Subclass must implement get_position")
@@ -47,7 +80,35 @@ class Actuator:
     def stop(self):
         raise NotImplementedError("Subclass must implement stop")
 
+
+# Actuator method handling each command type
+_DISPATCH: Dict[type, Callable[[Actuator, Command], Any]] = {
+    SetPositionCommand: lambda actuator, command: actuator.set_position(command.position),
+    SetVelocityCommand: lambda actuator, command: actuator.set_velocity(command.velocity),
+    SetTorqueCommand: lambda actuator, command: actuator.set_torque(command.torque),
+    GetPositionCommand: lambda actuator, command: actuator.get_position(),
+    GetVelocityCommand: lambda actuator, command: actuator.get_velocity(),
+    GetTorqueCommand: lambda actuator, command: actuator.get_torque(),
+    EnableCommand: lambda actuator, command: actuator.enable(),
+    DisableCommand: lambda actuator, command: actuator.disable(),
+    HomeCommand: lambda actuator, command: actuator.home(),
+    StopCommand: lambda actuator, command: actuator.stop(),
+}
+
+
+def _handler_for(command_type: type) -> Callable[[Actuator, Command], Any]:
+    """
+    Find the handler of a command type that is not in the dispatch table.
     
+    Args:
+        command_type: Type of the command being sent
         
-        
-        
\ No newline at end of file
+    Returns:
+        Handler registered for the nearest base class, cached for next time
+    """
+    for base in command_type.__mro__[1:]:
+        handler = _DISPATCH.get(base)
+        if handler is not None:
+            _DISPATCH[command_type] = handler
+            return handler
+    raise TypeError(f"Unsupported command type: {command_type.__name__}")
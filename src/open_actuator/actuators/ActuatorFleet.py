@@ -0,0 +1,80 @@
+import numpy as np
+from typing import Sequence
+from open_actuator.actuators.ACBv2 import ACBv2
+from open_actuator.interface import ActuatorState
+
+
+def _fleet_dtype(precision) -> np.dtype:
+    """Row layout with one column of the given float type per ActuatorState field."""
+    return np.dtype([(name, precision) for name in ActuatorState._fields])
+
+
+class ActuatorFleet:
+    """
+    Telemetry of several ACB v2.0 actuators in one structured array.
+
+    Each actuator's latest full state is a row of ``state``, so a field
+    across the whole fleet (e.g. ``fleet.positions``) is a strided view
+    into the rows that NumPy can check or clip in a single operation,
+    without copying.
+    """
+
+    def __init__(self, actuators: Sequence[ACBv2], precision=np.float64):
+        """
+        Initialize actuator fleet.
+
+        Args:
+            actuators: Connected actuators, in row order
+            precision: Float type of the state columns; np.float32 halves
+                the memory scanned by fleet-wide checks
+        """
+        self.actuators = list(actuators)
+        # NaN until an actuator's state has been read
+        self.state = np.full(len(self.actuators), np.nan, dtype=_fleet_dtype(precision))
+
+    def refresh(self) -> bool:
+        """
+        Read the full state of every actuator into its row.
+
+        Rows of actuators whose read failed are set to NaN.
+
+        Returns:
+            True if every actuator was read
+        """
+        success = True
+        for row, actuator in enumerate(self.actuators):
+            state = actuator.refresh_state()
+            if state is None:
+                self.state[row] = np.nan
+                success = False
+            else:
+                self.state[row] = state
+        return success
+
+    @property
+    def positions(self) -> np.ndarray:
+        """Get cached positions of all actuators."""
+        return self.state['position']
+
+    @property
+    def velocities(self) -> np.ndarray:
+        """Get cached velocities of all actuators."""
+        return self.state['velocity']
+
+    @property
+    def torques(self) -> np.ndarray:
+        """Get cached torques of all actuators."""
+        return self.state['torque']
+
+    @property
+    def temperatures(self) -> np.ndarray:
+        """Get cached board temperatures of all actuators."""
+        return self.state['temperature']
+
+    @property
+    def bus_voltages(self) -> np.ndarray:
+        """Get cached bus voltages of all actuators."""
+        return self.state['bus_voltage']
+
+    def __len__(self) -> int:
+        return len(self.actuators)
@@ -0,0 +1,108 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Iterable, List, Optional
+from open_actuator.actuators.ACBv2 import ACBv2
+from open_actuator.interface import USBInterface, ActuatorState
+
+
+class AsyncACBv2:
+    """
+    Asyncio front-end for ACB v2.0 actuators.
+
+    Exposes every ACBv2 method as a coroutine. Calls are executed on a
+    dedicated single-thread executor, so serial I/O never blocks the event
+    loop while requests to the actuator stay strictly ordered.
+    """
+
+    def __init__(self, interface: USBInterface):
+        """
+        Initialize asynchronous ACB v2.0 actuator.
+
+        Args:
+            interface: USB interface for communication
+        """
+        self.actuator = ACBv2(interface)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="acbv2-io")
+
+    async def _run(self, func, *args, **kwargs) -> Any:
+        """Run a blocking actuator call on the I/O thread."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, *args, **kwargs))
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self.actuator, name)
+        if not callable(attr):
+            # Cached state properties are plain reads, no I/O needed
+            return attr
+
+        async def method(*args, **kwargs):
+            return await self._run(attr, *args, **kwargs)
+
+        method.__name__ = name
+        method.__doc__ = attr.__doc__
+        return method
+
+    async def wait_until_enabled(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until the actuator has been enabled.
+
+        Waits on the default executor rather than the I/O thread, so the
+        enable() call being waited for is not queued behind the wait.
+
+        Args:
+            timeout: Maximum time to wait in seconds (None waits forever)
+
+        Returns:
+            True if the actuator is enabled
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.actuator.wait_until_enabled, timeout)
+
+    async def __aenter__(self) -> "AsyncACBv2":
+        """Connect to the actuator when entering an ``async with`` block."""
+        await self._run(self.actuator.connect)
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        """Disconnect from the actuator when leaving an ``async with`` block."""
+        await self.disconnect()
+
+    async def disconnect(self) -> None:
+        """Disconnect from the actuator and release the I/O thread."""
+        await self._run(self.actuator.disconnect)
+        self._executor.shutdown(wait=False)
+
+
+async def call_many(actuators: Iterable[AsyncACBv2], method: str, *args, **kwargs) -> List[Any]:
+    """
+    Call the same method on several actuators concurrently.
+
+    Each actuator runs its request on its own I/O thread, so the USB
+    round-trips overlap and the total latency is close to that of the
+    slowest single actuator rather than the sum of all of them.
+
+    Args:
+        actuators: Connected asynchronous actuators
+        method: Name of the ACBv2 method to call
+        *args: Positional arguments passed to every call
+        **kwargs: Keyword arguments passed to every call
+
+    Returns:
+        Result of each call, in order
+    """
+    return list(await asyncio.gather(*(getattr(actuator, method)(*args, **kwargs)
+                                       for actuator in actuators)))
+
+
+async def get_full_state_many(actuators: Iterable[AsyncACBv2]) -> List[Optional[ActuatorState]]:
+    """
+    Read the full state of several actuators concurrently.
+
+    Args:
+        actuators: Connected asynchronous actuators
+
+    Returns:
+        Full state of each actuator, in order (None where a read failed)
+    """
+    return await call_many(actuators, 'get_full_state')
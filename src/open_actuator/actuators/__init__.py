@@ -1,4 +1,6 @@
 from .ACBv2 import ACBv2
+from .AsyncACBv2 import AsyncACBv2, call_many, get_full_state_many
 from .Actuator import Actuator
+from .ActuatorFleet import ActuatorFleet
 
-__all__ = ['ACBv2', 'Actuator']
+__all__ = ['ACBv2', 'AsyncACBv2', 'Actuator', 'ActuatorFleet', 'call_many', 'get_full_state_many']
@@ -1,47 +1,100 @@
+import warnings
+
+
 class Command:
-    arguments: dict
-    def __init__(self, command: str, **arguments: dict):
+    """
+    Base class of actuator commands.
+
+    Each subclass has a fixed argument schema stored in its slots. Calling
+    Command(name, **arguments) directly is deprecated and builds a generic
+    command carrying the arguments in a dict.
+    """
+    __slots__ = ()
+    command: str = ""
+
+    def __new__(cls, *args, **kwargs):
+        if cls is Command:
+            warnings.warn(
+                "Command(name, **arguments) is deprecated; use the specific Command subclass",
+                DeprecationWarning, stacklevel=2)
+            cls = _GenericCommand
+        return super().__new__(cls)
+
+    @property
+    def arguments(self) -> dict:
+        """Get the command arguments by name."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+class _GenericCommand(Command):
+    """Command built through the deprecated Command(name, **arguments) form."""
+    __slots__ = ('command', 'arguments')
+
+    def __init__(self, command: str, **arguments):
         self.command = command
         self.arguments = arguments
 
+class _NullaryCommand(Command):
+    """Command without arguments; every construction returns one shared instance."""
+    __slots__ = ()
+
+    def __new__(cls):
+        instance = cls.__dict__.get('_instance')
+        if instance is None:
+            instance = super().__new__(cls)
+            cls._instance = instance
+        return instance
+
 class SetPositionCommand(Command):
+    __slots__ = ('position',)
+    command = "set_position"
     def __init__(self, position: float):
-        super().__init__("set_position", position=position)
+        self.position = position
 
 class SetVelocityCommand(Command):
+    __slots__ = ('velocity',)
+    command = "set_velocity"
     def __init__(self, velocity: float):
-        super().__init__("set_velocity", velocity=velocity)
+        self.velocity = velocity
 
 class SetTorqueCommand(Command):
+    __slots__ = ('torque',)
+    command = "set_torque"
     def __init__(self, torque: float):
-        super().__init__("set_torque", torque=torque)
+        self.torque = torque
 
-class GetPositionCommand(Command):
-    def __init__(self):
-        super().__init__("get_position")
+class GetPositionCommand(_NullaryCommand):
+    __slots__ = ()
+    command = "get_position"
 
-class GetVelocityCommand(Command):
-    def __init__(self):
-        super().__init__("get_velocity")
+class GetVelocityCommand(_NullaryCommand):
+    __slots__ = ()
+    command = "get_velocity"
 
-class GetTorqueCommand(Command):
-    def __init__(self):
-        super().__init__("get_torque")
+class GetTorqueCommand(_NullaryCommand):
+    __slots__ = ()
+    command = "get_torque"
 
-class EnableCommand(Command):
-    def __init__(self):
-        super().__init__("enable")
+class EnableCommand(_NullaryCommand):
+    __slots__ = ()
+    command = "enable"
 
-class DisableCommand(Command):
-    def __init__(self):
-        super().__init__("disable")
+class DisableCommand(_NullaryCommand):
+    __slots__ = ()
+    command = "disable"
 
-class HomeCommand(Command):
-    def __init__(self):
-        super().__init__("home")
+class HomeCommand(_NullaryCommand):
+    __slots__ = ()
+    command = "home"
 
-class StopCommand(Command):
-    def __init__(self):
-        super().__init__("stop")
+class StopCommand(_NullaryCommand):
+    __slots__ = ()
+    command = "stop"
 
-        
\ No newline at end of file
+# Shared instances of the argument-less commands
+GET_POSITION = GetPositionCommand()
+GET_VELOCITY = GetVelocityCommand()
+GET_TORQUE = GetTorqueCommand()
+ENABLE = EnableCommand()
+DISABLE = DisableCommand()
+HOME = HomeCommand()
+STOP = StopCommand()
@@ -9,12 +9,80 @@ import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 import threading
 import time
-from typing import Optional, Dict, Any
-import serial.tools.list_ports
+import weakref
+from collections import deque
+import numpy as np
+from typing import TYPE_CHECKING, Optional, Dict, Any, List
 
 from ..interface import USBInterface, CommandMode
 from ..actuators.ACBv2 import ACBv2
-from .plotter import ActuatorPlotter
+from .ring_buffer import RingBuffer
+
+if TYPE_CHECKING:
+    # Imports matplotlib; loaded when the plot frame is built
+    from .plotter import ActuatorPlotter
+
+
+# Map mode combobox labels to CommandMode enum
+_MODE_MAP = {
+    'Human Readable': CommandMode.HUMAN_READABLE,
+    'High Speed Binary': CommandMode.HIGH_SPEED_BINARY,
+    'SimpleFOC': CommandMode.SIMPLEFOC
+}
+
+# Setpoint steps offered by the preset buttons; 0 sets the setpoint to zero
+_PRESET_STEPS = (-1000, -100, -10, 0, 10, 100, 1000)
+
+# Samples kept per channel by manual monitoring
+_MONITOR_HISTORY = 100
+
+# Samples buffered between the polling threads and the UI; the oldest are
+# dropped if the UI stalls
+_SAMPLE_QUEUE_SIZE = 1024
+
+# Interval in ms at which the UI thread drains the sample queue
+_DRAIN_INTERVAL_MS = 20
+
+# Status readouts and their display formats, in ActuatorState field order
+_READOUT_FORMATS = {
+    'position': "%.2f°",
+    'velocity': "%.2f°/s",
+    'torque': "%.2f Nm",
+    'temperature': "%.1f°C",
+    'bus_voltage': "%.2f V",
+    'internal_temperature': "%.1f°C",
+}
+
+# Lines kept in the communication log; older lines are dropped
+_LOG_MAX_LINES = 500
+
+# Time in ms that informational toasts stay visible
+_TOAST_MS = 2000
+
+# Fonts of the custom label styles
+_TITLE_FONT = ('Arial', 16, 'bold')
+_HEADING_FONT = ('Arial', 12, 'bold')
+_STATUS_FONT = ('Arial', 10)
+
+# Tk roots whose ttk styles are configured; styles belong to the root's interpreter
+_STYLED_ROOTS = weakref.WeakSet()
+
+
+def _init_styles(root: tk.Tk) -> None:
+    """Configure the GUI's ttk theme and styles once per Tk root."""
+    if root in _STYLED_ROOTS:
+        return
+    style = ttk.Style(root)
+    style.theme_use('clam')
+    
+    # Configure custom styles
+    style.configure('Title.TLabel', font=_TITLE_FONT)
+    style.configure('Heading.TLabel', font=_HEADING_FONT)
+    style.configure('Status.TLabel', font=_STATUS_FONT)
+    style.configure('Success.TLabel', foreground='green')
+    style.configure('Error.TLabel', foreground='red')
+    style.configure('Unsaved.TEntry', fieldbackground='#ffffcc')  # Light yellow background
+    _STYLED_ROOTS.add(root)
 
 
 class ActuatorGUI:
@@ -28,6 +96,7 @@ class ActuatorGUI:
     def __init__(self):
         """Initialize the GUI application."""
         self.root = tk.Tk()
+        self._tk = self.root.tk
         self.root.title("Open Actuator Control")
         self.root.configure(bg='#f0f0f0')
         
@@ -39,6 +108,11 @@ class ActuatorGUI:
         self.monitoring = False
         self.monitor_thread: Optional[threading.Thread] = None
         
+        # Set to cut a polling thread's wait short when it is stopped
+        self._monitor_wake = threading.Event()
+        self._status_wake = threading.Event()
+        self._plotting_wake = threading.Event()
+        
         # Status monitoring
         self.status_monitoring = False
         self.status_thread: Optional[threading.Thread] = None
@@ -50,10 +124,8 @@ class ActuatorGUI:
         
         # Data storage for plotting
         self.data_history = {
-            'position': [],
-            'velocity': [],
-            'torque': [],
-            'time': []
+            key: RingBuffer(_MONITOR_HISTORY, np.int64 if key == 'time' else np.float64)
+            for key in ('position', 'velocity', 'torque', 'time')
         }
         
         # Track unsaved changes
@@ -64,11 +136,31 @@ class ActuatorGUI:
         }
         
         # Plotter instance
-        self.plotter: Optional[ActuatorPlotter] = None
+        self.plotter: Optional["ActuatorPlotter"] = None
+        
+        # Readings posted by the polling threads, applied on the UI thread
+        self.sample_q = deque(maxlen=_SAMPLE_QUEUE_SIZE)
+        
+        # Tcl command shared by the setpoint preset buttons
+        self._preset_command: Optional[str] = None
+        
+        # Log entries waiting for the next idle point, and lines shown
+        self._log_pending: List[str] = []
+        self._log_lines = 0
+        
+        # Newest status readouts waiting for the next idle point
+        self._pending_readouts: Dict[str, float] = {}
+        
+        # Last serial port scan, so the combobox never waits on a rescan
+        self._ports_cache: List[str] = []
+        self._ports_thread: Optional[threading.Thread] = None
         
         self.setup_ui()
         self.setup_styles()
         
+        # Start applying queued readings from the Tk event loop
+        self.root.after(_DRAIN_INTERVAL_MS, self._drain_samples)
+        
         # Auto-resize window to fit content
         self.root.after(100, self.auto_resize_window)
         
@@ -110,16 +202,7 @@ class ActuatorGUI:
         
     def setup_styles(self) -> None:
         """Configure GUI styles and themes."""
-        style = ttk.Style()
-        style.theme_use('clam')
-        
-        # Configure custom styles
-        style.configure('Title.TLabel', font=('Arial', 16, 'bold'))
-        style.configure('Heading.TLabel', font=('Arial', 12, 'bold'))
-        style.configure('Status.TLabel', font=('Arial', 10))
-        style.configure('Success.TLabel', foreground='green')
-        style.configure('Error.TLabel', foreground='red')
-        style.configure('Unsaved.TEntry', fieldbackground='#ffffcc')  # Light yellow background
+        _init_styles(self.root)
         
     def setup_ui(self) -> None:
         """Set up the main user interface."""
@@ -200,7 +283,7 @@ class ActuatorGUI:
         if not self.connected or not self.actuator:
             messagebox.showerror("Error", "Please connect to an actuator first")
             return
-        messagebox.showinfo("Calibrate Sensors", "Sensor calibration started...")
+        self._toast("Sensor calibration started...")
     
     def reset_to_defaults(self) -> None:
         """Reset actuator to default settings."""
@@ -208,19 +291,30 @@ class ActuatorGUI:
             messagebox.showerror("Error", "Please connect to an actuator first")
             return
         if messagebox.askyesno("Reset to Defaults", "Are you sure you want to reset to default settings?"):
-            messagebox.showinfo("Reset", "Settings reset to defaults!")
+            self._toast("Settings reset to defaults!")
     
     def clear_data_history(self) -> None:
         """Clear the data history."""
-        self.data_history = {
-            'position': [],
-            'velocity': [],
-            'torque': [],
-            'time': []
-        }
-        messagebox.showinfo("Clear Data", "Data history cleared!")
+        for buffer in self.data_history.values():
+            buffer.clear()
+        self._toast("Data history cleared!")
     
     
+    def _toast(self, message: str, duration_ms: int = _TOAST_MS) -> None:
+        """
+        Show a short notice that closes itself.
+        
+        Unlike messagebox.showinfo this does not run a nested event loop,
+        so queued readings and plot frames keep flowing. Errors and
+        questions stay modal.
+        """
+        toast = tk.Toplevel(self.root)
+        toast.overrideredirect(True)
+        toast.transient(self.root)
+        ttk.Label(toast, text=message, padding=10, style='Status.TLabel').pack()
+        toast.geometry(f"+{self.root.winfo_rootx() + 20}+{self.root.winfo_rooty() + 20}")
+        toast.after(duration_ms, toast.destroy)
+    
     def show_about(self) -> None:
         """Show about dialog."""
         messagebox.showinfo("About", "Open Actuator Control v1.0\n\nA comprehensive GUI for controlling actuators.")
@@ -294,9 +388,14 @@ class ActuatorGUI:
         button_frame = ttk.Frame(main_frame)
         button_frame.pack(fill=tk.X, pady=(20, 0))
         
-        ttk.Button(button_frame, text="Cancel", command=setup_window.destroy).pack(side=tk.RIGHT, padx=(10, 0))
-        ttk.Button(button_frame, text="Calibrate & Save", 
-                  command=lambda: self.perform_actuator_setup(setup_window)).pack(side=tk.RIGHT)
+        cancel_btn = ttk.Button(button_frame, text="Cancel", command=setup_window.destroy)
+        cancel_btn.pack(side=tk.RIGHT, padx=(10, 0))
+        calibrate_btn = ttk.Button(button_frame, text="Calibrate & Save", 
+                                   command=lambda: self.perform_actuator_setup(setup_window))
+        calibrate_btn.pack(side=tk.RIGHT)
+        
+        # Controls disabled while the setup runs
+        self._setup_controls = [pole_pairs_entry, cancel_btn, calibrate_btn]
         
     def perform_actuator_setup(self, setup_window: tk.Toplevel) -> None:
         """Perform the actuator setup process."""
@@ -329,10 +428,8 @@ class ActuatorGUI:
             
         # Disable the setup window during process
         setup_window.config(cursor="watch")
-        for widget in setup_window.winfo_children():
-            for child in widget.winfo_children():
-                if isinstance(child, (ttk.Button, ttk.Entry)):
-                    child.config(state='disabled')
+        for control in self._setup_controls:
+            control.config(state='disabled')
         
         try:
             # Step 1: Set pole pairs
@@ -365,12 +462,11 @@ class ActuatorGUI:
             messagebox.showerror("Error", f"Setup failed: {str(e)}")
             self.log_message(f"ERROR: Setup failed: {str(e)}")
         finally:
-            # Re-enable the setup window
-            setup_window.config(cursor="")
-            for widget in setup_window.winfo_children():
-                for child in widget.winfo_children():
-                    if isinstance(child, (ttk.Button, ttk.Entry)):
-                        child.config(state='normal')
+            # Re-enable the setup window unless setup closed it
+            if setup_window.winfo_exists():
+                setup_window.config(cursor="")
+                for control in self._setup_controls:
+                    control.config(state='normal')
         
     def setup_connection_frame(self, parent: ttk.Frame, row: int) -> None:
         """Set up the connection configuration frame."""
@@ -398,7 +494,7 @@ class ActuatorGUI:
         ttk.Label(conn_frame, text="Mode:").grid(row=2, column=0, sticky=tk.W, padx=(0, 5), pady=(5, 0))
         self.mode_var = tk.StringVar(value="Human Readable")
         mode_combo = ttk.Combobox(conn_frame, textvariable=self.mode_var, width=15)
-        mode_combo['values'] = ('Human Readable', 'High Speed Binary', 'SimpleFOC')
+        mode_combo['values'] = tuple(_MODE_MAP)
         mode_combo.grid(row=2, column=1, sticky=tk.W, padx=(0, 5), pady=(5, 0))
         
         # Connect/Disconnect button
@@ -427,19 +523,14 @@ class ActuatorGUI:
         pos_preset_frame.grid(row=0, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(0, 5))
         
         # Preset buttons for position
-        ttk.Button(pos_preset_frame, text="-1000", command=lambda: self.increment_position_value(-1000)).grid(row=0, column=0, padx=(0, 2))
-        ttk.Button(pos_preset_frame, text="-100", command=lambda: self.increment_position_value(-100)).grid(row=0, column=1, padx=(0, 2))
-        ttk.Button(pos_preset_frame, text="-10", command=lambda: self.increment_position_value(-10)).grid(row=0, column=2, padx=(0, 2))
-        ttk.Button(pos_preset_frame, text="0", command=lambda: self.set_position_value(0)).grid(row=0, column=3, padx=(0, 2))
-        ttk.Button(pos_preset_frame, text="+10", command=lambda: self.increment_position_value(10)).grid(row=0, column=4, padx=(0, 2))
-        ttk.Button(pos_preset_frame, text="+100", command=lambda: self.increment_position_value(100)).grid(row=0, column=5, padx=(0, 2))
-        ttk.Button(pos_preset_frame, text="+1000", command=lambda: self.increment_position_value(1000)).grid(row=0, column=6, padx=(0, 2))
+        self._make_preset_row(pos_preset_frame, 'position')
         
         # Position input and set button
         pos_input_frame = ttk.Frame(pos_frame)
         pos_input_frame.grid(row=1, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(5, 0))
         
         self.position_var = tk.DoubleVar()
+        self._position_tk = self.position_var._name
         position_entry = ttk.Entry(pos_input_frame, textvariable=self.position_var, width=15)
         position_entry.grid(row=0, column=0, padx=(0, 5))
         
@@ -455,19 +546,14 @@ class ActuatorGUI:
         vel_preset_frame.grid(row=0, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(0, 5))
         
         # Preset buttons for velocity
-        ttk.Button(vel_preset_frame, text="-1000", command=lambda: self.increment_velocity_value(-1000)).grid(row=0, column=0, padx=(0, 2))
-        ttk.Button(vel_preset_frame, text="-100", command=lambda: self.increment_velocity_value(-100)).grid(row=0, column=1, padx=(0, 2))
-        ttk.Button(vel_preset_frame, text="-10", command=lambda: self.increment_velocity_value(-10)).grid(row=0, column=2, padx=(0, 2))
-        ttk.Button(vel_preset_frame, text="0", command=lambda: self.set_velocity_value(0)).grid(row=0, column=3, padx=(0, 2))
-        ttk.Button(vel_preset_frame, text="+10", command=lambda: self.increment_velocity_value(10)).grid(row=0, column=4, padx=(0, 2))
-        ttk.Button(vel_preset_frame, text="+100", command=lambda: self.increment_velocity_value(100)).grid(row=0, column=5, padx=(0, 2))
-        ttk.Button(vel_preset_frame, text="+1000", command=lambda: self.increment_velocity_value(1000)).grid(row=0, column=6, padx=(0, 2))
+        self._make_preset_row(vel_preset_frame, 'velocity')
         
         # Velocity input and set button
         vel_input_frame = ttk.Frame(vel_frame)
         vel_input_frame.grid(row=1, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(5, 0))
         
         self.velocity_var = tk.DoubleVar()
+        self._velocity_tk = self.velocity_var._name
         velocity_entry = ttk.Entry(vel_input_frame, textvariable=self.velocity_var, width=15)
         velocity_entry.grid(row=0, column=0, padx=(0, 5))
         
@@ -483,19 +569,14 @@ class ActuatorGUI:
         torque_preset_frame.grid(row=0, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(0, 5))
         
         # Preset buttons for torque
-        ttk.Button(torque_preset_frame, text="-1000", command=lambda: self.increment_torque_value(-1000)).grid(row=0, column=0, padx=(0, 2))
-        ttk.Button(torque_preset_frame, text="-100", command=lambda: self.increment_torque_value(-100)).grid(row=0, column=1, padx=(0, 2))
-        ttk.Button(torque_preset_frame, text="-10", command=lambda: self.increment_torque_value(-10)).grid(row=0, column=2, padx=(0, 2))
-        ttk.Button(torque_preset_frame, text="0", command=lambda: self.set_torque_value(0)).grid(row=0, column=3, padx=(0, 2))
-        ttk.Button(torque_preset_frame, text="+10", command=lambda: self.increment_torque_value(10)).grid(row=0, column=4, padx=(0, 2))
-        ttk.Button(torque_preset_frame, text="+100", command=lambda: self.increment_torque_value(100)).grid(row=0, column=5, padx=(0, 2))
-        ttk.Button(torque_preset_frame, text="+1000", command=lambda: self.increment_torque_value(1000)).grid(row=0, column=6, padx=(0, 2))
+        self._make_preset_row(torque_preset_frame, 'torque')
         
         # Torque input and set button
         torque_input_frame = ttk.Frame(torque_frame)
         torque_input_frame.grid(row=1, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(5, 0))
         
         self.torque_var = tk.DoubleVar()
+        self._torque_tk = self.torque_var._name
         torque_entry = ttk.Entry(torque_input_frame, textvariable=self.torque_var, width=15)
         torque_entry.grid(row=0, column=0, padx=(0, 5))
         
@@ -537,6 +618,24 @@ class ActuatorGUI:
         ttk.Label(full_state_frame, text="Full State:", style='Heading.TLabel').grid(row=0, column=0, sticky=tk.W, padx=(0, 5))
         ttk.Button(full_state_frame, text="Get Full State", command=self.get_full_state).grid(row=0, column=1, padx=(0, 5))
         
+    def _make_preset_row(self, parent: ttk.Frame, kind: str) -> None:
+        """Create a row of preset buttons that step a setpoint or set it to zero."""
+        # One Tcl command serves every preset button; each button passes its own arguments
+        if self._preset_command is None:
+            self._preset_command = self.root.register(self._on_preset)
+        for column, step in enumerate(_PRESET_STEPS):
+            text = f"{step:+d}" if step else "0"
+            button = ttk.Button(parent, text=text, command=(self._preset_command, kind, step))
+            button.grid(row=0, column=column, padx=(0, 2))
+        
+    def _on_preset(self, kind: str, step: str) -> None:
+        """Handle a preset button: step the setpoint, or set it to zero for step 0."""
+        step = int(step)
+        if step:
+            getattr(self, f"increment_{kind}_value")(step)
+        else:
+            getattr(self, f"set_{kind}_value")(0)
+        
     def setup_pid_frame(self, parent: ttk.Frame, row: int) -> None:
         """Set up the PID control frame."""
         pid_frame = ttk.LabelFrame(parent, text="PID Control", padding="10")
@@ -680,28 +779,29 @@ class ActuatorGUI:
         self.connection_status.grid(row=0, column=1, sticky=tk.W)
         
         # Current values
+        self.readout_vars = {key: tk.StringVar(value="N/A") for key in _READOUT_FORMATS}
         ttk.Label(status_frame, text="Position:").grid(row=1, column=0, sticky=tk.W, padx=(0, 5), pady=(5, 0))
-        self.position_status = ttk.Label(status_frame, text="N/A", style='Status.TLabel')
+        self.position_status = ttk.Label(status_frame, textvariable=self.readout_vars['position'], style='Status.TLabel')
         self.position_status.grid(row=1, column=1, sticky=tk.W, pady=(5, 0))
         
         ttk.Label(status_frame, text="Velocity:").grid(row=2, column=0, sticky=tk.W, padx=(0, 5))
-        self.velocity_status = ttk.Label(status_frame, text="N/A", style='Status.TLabel')
+        self.velocity_status = ttk.Label(status_frame, textvariable=self.readout_vars['velocity'], style='Status.TLabel')
         self.velocity_status.grid(row=2, column=1, sticky=tk.W)
         
         ttk.Label(status_frame, text="Torque:").grid(row=3, column=0, sticky=tk.W, padx=(0, 5))
-        self.torque_status = ttk.Label(status_frame, text="N/A", style='Status.TLabel')
+        self.torque_status = ttk.Label(status_frame, textvariable=self.readout_vars['torque'], style='Status.TLabel')
         self.torque_status.grid(row=3, column=1, sticky=tk.W)
         
         ttk.Label(status_frame, text="Temperature:").grid(row=4, column=0, sticky=tk.W, padx=(0, 5), pady=(5, 0))
-        self.temperature_status = ttk.Label(status_frame, text="N/A", style='Status.TLabel')
+        self.temperature_status = ttk.Label(status_frame, textvariable=self.readout_vars['temperature'], style='Status.TLabel')
         self.temperature_status.grid(row=4, column=1, sticky=tk.W, pady=(5, 0))
         
         ttk.Label(status_frame, text="Internal Temp:").grid(row=5, column=0, sticky=tk.W, padx=(0, 5))
-        self.internal_temperature_status = ttk.Label(status_frame, text="N/A", style='Status.TLabel')
+        self.internal_temperature_status = ttk.Label(status_frame, textvariable=self.readout_vars['internal_temperature'], style='Status.TLabel')
         self.internal_temperature_status.grid(row=5, column=1, sticky=tk.W)
         
         ttk.Label(status_frame, text="Bus Voltage:").grid(row=6, column=0, sticky=tk.W, padx=(0, 5), pady=(5, 0))
-        self.bus_voltage_status = ttk.Label(status_frame, text="N/A", style='Status.TLabel')
+        self.bus_voltage_status = ttk.Label(status_frame, textvariable=self.readout_vars['bus_voltage'], style='Status.TLabel')
         self.bus_voltage_status.grid(row=6, column=1, sticky=tk.W, pady=(5, 0))
         
     def setup_plot_frame(self, parent: ttk.Frame, row: int) -> None:
@@ -734,6 +834,7 @@ class ActuatorGUI:
         self.plot_status.grid(row=0, column=4, padx=(20, 0))
         
         # Create plotter with increased spacing and more data points for smooth plotting
+        from .plotter import ActuatorPlotter
         self.plotter = ActuatorPlotter(plot_frame, max_points=500)
         self.plotter.get_canvas().get_tk_widget().grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         
@@ -752,12 +853,27 @@ class ActuatorGUI:
         ttk.Button(log_frame, text="Clear Log", command=self.clear_log).grid(row=1, column=0, pady=(5, 0))
         
     def refresh_ports(self) -> None:
-        """Refresh the list of available serial ports."""
+        """Refresh the list of available serial ports in the background."""
+        if self._ports_cache:
+            self._show_ports(self._ports_cache)
+        # Listing ports can probe udev/sysfs for a noticeable time; keep it off the UI thread
+        if self._ports_thread is None or not self._ports_thread.is_alive():
+            self._ports_thread = threading.Thread(target=self._scan_ports_worker, daemon=True)
+            self._ports_thread.start()
+            
+    def _scan_ports_worker(self) -> None:
+        """List serial ports and post the result to the sample queue."""
+        import serial.tools.list_ports
         all_ports = [port.device for port in serial.tools.list_ports.comports()]
         # Filter out /dev/ttyS* devices (system serial ports)
         ports = [port for port in all_ports if not port.startswith('/dev/ttyS')]
+        self.sample_q.append(('ports', ports))
+        
+    def _show_ports(self, ports: List[str]) -> None:
+        """Offer the given ports in the port combobox."""
+        self._ports_cache = ports
         self.port_combo['values'] = ports
-        if ports:
+        if ports and self.port_var.get() not in ports:
             self.port_combo.set(ports[0])
         
     def toggle_connection(self) -> None:
@@ -780,19 +896,11 @@ class ActuatorGUI:
             messagebox.showerror("Error", "Invalid baud rate")
             return
             
-        # Create USB interface and ACBv2 actuator
-        usb_interface = USBInterface(port, baudrate)
+        # Create USB interface and ACBv2 actuator; the interface switches to the mode on connect
+        mode = _MODE_MAP.get(self.mode_var.get(), CommandMode.HUMAN_READABLE)
+        usb_interface = USBInterface(port, baudrate, mode=mode)
         self.actuator = ACBv2(usb_interface)
         
-        # Set command mode on the interface
-        mode_map = {
-            'Human Readable': CommandMode.HUMAN_READABLE,
-            'High Speed Binary': CommandMode.HIGH_SPEED_BINARY,
-            'SimpleFOC': CommandMode.SIMPLEFOC
-        }
-        mode = mode_map.get(self.mode_var.get(), CommandMode.HUMAN_READABLE)
-        self.actuator.interface.command_mode = mode
-        
         if self.actuator.connect():
             self.connected = True
             self.connect_btn.config(text="Disconnect")
@@ -847,18 +955,10 @@ class ActuatorGUI:
             return
             
         # Create temporary USB interface and ACBv2 actuator for testing
-        test_usb_interface = USBInterface(port, baudrate)
+        mode = _MODE_MAP.get(self.mode_var.get(), CommandMode.HUMAN_READABLE)
+        test_usb_interface = USBInterface(port, baudrate, mode=mode)
         test_actuator = ACBv2(test_usb_interface)
         
-        # Set command mode on the interface
-        mode_map = {
-            'Human Readable': CommandMode.HUMAN_READABLE,
-            'High Speed Binary': CommandMode.HIGH_SPEED_BINARY,
-            'SimpleFOC': CommandMode.SIMPLEFOC
-        }
-        mode = mode_map.get(self.mode_var.get(), CommandMode.HUMAN_READABLE)
-        test_actuator.interface.command_mode = mode
-        
         if test_actuator.connect():
             # Test basic commands
             if not test_actuator.enable():
@@ -885,12 +985,7 @@ class ActuatorGUI:
         state = self.actuator.get_full_state()
         if state is not None:
             # Update status display
-            self.position_status.config(text=f"{state['position']:.2f}°")
-            self.velocity_status.config(text=f"{state['velocity']:.2f}°/s")
-            self.torque_status.config(text=f"{state['torque']:.2f} Nm")
-            self.temperature_status.config(text=f"{state['temperature']:.1f}°C")
-            self.bus_voltage_status.config(text=f"{state['bus_voltage']:.2f} V")
-            self.internal_temperature_status.config(text=f"{state['internal_temperature']:.1f}°C")
+            self._set_readouts(zip(_READOUT_FORMATS, state))
         else:
             self.log_message("ERROR: Failed to get full state")
         
@@ -900,7 +995,7 @@ class ActuatorGUI:
             messagebox.showerror("Error", "Not connected to actuator")
             return
             
-        position = self.position_var.get()
+        position = self._get_float(self._position_tk)
         if not self.actuator.set_position(position):
             self.log_message(f"ERROR: Failed to set position to {position}°")
             
@@ -910,7 +1005,7 @@ class ActuatorGUI:
             messagebox.showerror("Error", "Not connected to actuator")
             return
             
-        velocity = self.velocity_var.get()
+        velocity = self._get_float(self._velocity_tk)
         if not self.actuator.set_velocity(velocity):
             self.log_message(f"ERROR: Failed to set velocity to {velocity}°/s")
             
@@ -920,10 +1015,22 @@ class ActuatorGUI:
             messagebox.showerror("Error", "Not connected to actuator")
             return
             
-        torque = self.torque_var.get()
+        torque = self._get_float(self._torque_tk)
         if not self.actuator.set_torque(torque):
             self.log_message(f"ERROR: Failed to set torque to {torque} Nm")
     
+    def _get_float(self, name: str) -> float:
+        """
+        Read a setpoint Tcl variable by name.
+        
+        Same result as DoubleVar.get, without the wrapper's lookups and
+        with no conversion when Tcl already holds a float.
+        """
+        value = self._tk.globalgetvar(name)
+        if type(value) is float:
+            return value
+        return self._tk.getdouble(value)
+    
     def set_position_value(self, value: float) -> None:
         """Set position value and send command."""
         self.position_var.set(value)
@@ -941,22 +1048,19 @@ class ActuatorGUI:
     
     def increment_position_value(self, increment: float) -> None:
         """Increment position value and send command."""
-        current_value = self.position_var.get()
-        new_value = current_value + increment
+        new_value = self._get_float(self._position_tk) + increment
         self.position_var.set(new_value)
         self.set_position()
     
     def increment_velocity_value(self, increment: float) -> None:
         """Increment velocity value and send command."""
-        current_value = self.velocity_var.get()
-        new_value = current_value + increment
+        new_value = self._get_float(self._velocity_tk) + increment
         self.velocity_var.set(new_value)
         self.set_velocity()
     
     def increment_torque_value(self, increment: float) -> None:
         """Increment torque value and send command."""
-        current_value = self.torque_var.get()
-        new_value = current_value + increment
+        new_value = self._get_float(self._torque_tk) + increment
         self.torque_var.set(new_value)
         self.set_torque()
             
@@ -1014,7 +1118,7 @@ class ActuatorGUI:
             return
             
         if self.actuator.reset_position():
-            messagebox.showinfo("Reset Complete", "Actuator position has been reset to zero.")
+            self._toast("Actuator position has been reset to zero.")
         else:
             self.log_message("ERROR: Failed to reset position")
             messagebox.showerror("Error", "Failed to reset actuator position")
@@ -1035,7 +1139,24 @@ class ActuatorGUI:
         if not result:
             return
             
-        if self.actuator.recalibrate_sensors():
+        calibration = self.actuator.begin_recalibrate_sensors()
+        if calibration is None:
+            self.log_message("ERROR: Failed to recalibrate sensors")
+            messagebox.showerror("Error", "Failed to recalibrate sensors")
+            return
+            
+        # Poll from the event loop so the window stays responsive while calibrating
+        self.log_message("Recalibrating sensors...")
+        self.poll_recalibration(calibration, time.monotonic() + 5.0)
+        
+    def poll_recalibration(self, calibration, deadline: float) -> None:
+        """Check a running recalibration and report the result once it finishes."""
+        result = calibration.poll()
+        if result is None and time.monotonic() < deadline:
+            self.root.after(20, self.poll_recalibration, calibration, deadline)
+            return
+            
+        if result:
             messagebox.showinfo(
                 "Recalibration Complete", 
                 "Sensor recalibration completed successfully.\n\n"
@@ -1053,7 +1174,7 @@ class ActuatorGUI:
             
         position = self.actuator.get_position()
         if position is not None:
-            self.position_status.config(text=f"{position:.2f}°")
+            self._set_readouts((('position', position),))
         else:
             self.log_message("ERROR: Failed to get position")
             
@@ -1065,7 +1186,7 @@ class ActuatorGUI:
             
         velocity = self.actuator.get_velocity()
         if velocity is not None:
-            self.velocity_status.config(text=f"{velocity:.2f}°/s")
+            self._set_readouts((('velocity', velocity),))
         else:
             self.log_message("ERROR: Failed to get velocity")
             
@@ -1077,7 +1198,7 @@ class ActuatorGUI:
             
         torque = self.actuator.get_torque()
         if torque is not None:
-            self.torque_status.config(text=f"{torque:.2f} Nm")
+            self._set_readouts((('torque', torque),))
         else:
             self.log_message("ERROR: Failed to get torque")
     
@@ -1089,7 +1210,7 @@ class ActuatorGUI:
             
         temperature = self.actuator.get_temperature()
         if temperature is not None:
-            self.temperature_status.config(text=f"{temperature:.1f}°C")
+            self._set_readouts((('temperature', temperature),))
         else:
             self.log_message("ERROR: Failed to get temperature")
     
@@ -1101,7 +1222,7 @@ class ActuatorGUI:
             
         bus_voltage = self.actuator.get_bus_voltage()
         if bus_voltage is not None:
-            self.bus_voltage_status.config(text=f"{bus_voltage:.2f} V")
+            self._set_readouts((('bus_voltage', bus_voltage),))
         else:
             self.log_message("ERROR: Failed to get bus voltage")
     
@@ -1113,7 +1234,7 @@ class ActuatorGUI:
             
         internal_temperature = self.actuator.get_internal_temperature()
         if internal_temperature is not None:
-            self.internal_temperature_status.config(text=f"{internal_temperature:.1f}°C")
+            self._set_readouts((('internal_temperature', internal_temperature),))
         else:
             self.log_message("ERROR: Failed to get internal temperature")
     
@@ -1302,6 +1423,7 @@ class ActuatorGUI:
             return
             
         self.monitoring = True
+        self._monitor_wake.clear()
         self.monitor_btn.config(text="Stop Monitoring")
         self.monitor_thread = threading.Thread(target=self.monitor_loop, daemon=True)
         self.monitor_thread.start()
@@ -1309,7 +1431,10 @@ class ActuatorGUI:
     def stop_monitoring(self) -> None:
         """Stop real-time monitoring."""
         self.monitoring = False
+        self._monitor_wake.set()
         self.monitor_btn.config(text="Start Monitoring")
+        if self.monitor_thread:
+            self.monitor_thread.join(timeout=1.0)
     
     def start_status_monitoring(self) -> None:
         """Start status monitoring at 2Hz."""
@@ -1317,104 +1442,164 @@ class ActuatorGUI:
             return
             
         self.status_monitoring = True
+        self._status_wake.clear()
         self.status_thread = threading.Thread(target=self.status_monitor_loop, daemon=True)
         self.status_thread.start()
         
     def stop_status_monitoring(self) -> None:
         """Stop status monitoring."""
         self.status_monitoring = False
+        self._status_wake.set()
         if self.status_thread:
             self.status_thread.join(timeout=1.0)
         
     def status_monitor_loop(self) -> None:
         """Status monitoring loop at 2Hz."""
+        # Keep the actuator this loop was started for; disconnect clears self.actuator
+        actuator = self.actuator
         while self.status_monitoring and self.connected:
             try:
                 # Get all status values
-                position = self.actuator.get_position()
-                velocity = self.actuator.get_velocity()
-                torque = self.actuator.get_torque()
-                temperature = self.actuator.get_temperature()
-                internal_temperature = self.actuator.get_internal_temperature()
-                bus_voltage = self.actuator.get_bus_voltage()
+                position = actuator.get_position()
+                velocity = actuator.get_velocity()
+                torque = actuator.get_torque()
+                temperature = actuator.get_temperature()
+                internal_temperature = actuator.get_internal_temperature()
+                bus_voltage = actuator.get_bus_voltage()
                 
-                # Update status display
-                def update_status():
-                    if position is not None:
-                        self.position_status.config(text=f"{position:.2f}°")
-                    if velocity is not None:
-                        self.velocity_status.config(text=f"{velocity:.2f}°/s")
-                    if torque is not None:
-                        self.torque_status.config(text=f"{torque:.2f} Nm")
-                    if temperature is not None:
-                        self.temperature_status.config(text=f"{temperature:.1f}°C")
-                    if internal_temperature is not None:
-                        self.internal_temperature_status.config(text=f"{internal_temperature:.1f}°C")
-                    if bus_voltage is not None:
-                        self.bus_voltage_status.config(text=f"{bus_voltage:.2f} V")
-                
-                self.root.after(0, update_status)
+                self.sample_q.append(('status', position, velocity, torque,
+                                      temperature, bus_voltage, internal_temperature))
                 
             except Exception as e:
-                self.log_message(f"Status monitoring error: {e}")
+                self.sample_q.append(('log', f"Status monitoring error: {e}"))
                 break
                 
-            time.sleep(0.5)  # 2Hz update rate
+            self._status_wake.wait(0.5)  # 2Hz update rate
         
         
     def monitor_loop(self) -> None:
         """Real-time monitoring loop for data collection and plotting."""
+        actuator = self.actuator
         while self.monitoring and self.connected:
             try:
                 # Get current values (status panel already updates at 2Hz automatically)
-                position = self.actuator.get_position()
-                velocity = self.actuator.get_velocity()
-                torque = self.actuator.get_torque()
-                
-                # Store data for plotting
-                current_time = time.time()
-                self.data_history['time'].append(current_time)
-                self.data_history['position'].append(position if position is not None else 0)
-                self.data_history['velocity'].append(velocity if velocity is not None else 0)
-                self.data_history['torque'].append(torque if torque is not None else 0)
-                
-                # Keep only last 100 data points
-                if len(self.data_history['time']) > 100:
-                    for key in self.data_history:
-                        self.data_history[key] = self.data_history[key][-100:]
+                position = actuator.get_position()
+                velocity = actuator.get_velocity()
+                torque = actuator.get_torque()
                 
                 # Get current measurements (silently)
-                current_a = self.actuator.get_current_a()
-                current_b = self.actuator.get_current_b()
-                current_c = self.actuator.get_current_c()
+                current_a = actuator.get_current_a()
+                current_b = actuator.get_current_b()
+                current_c = actuator.get_current_c()
                 
-                # Send data to plotter if it exists and is plotting
-                if self.plotter and self.plotter.plotting:
-                    self.plotter.add_data_point(
-                        position if position is not None else 0,
-                        velocity if velocity is not None else 0,
-                        torque if torque is not None else 0,
-                        current_a if current_a is not None else 0,
-                        current_b if current_b is not None else 0,
-                        current_c if current_c is not None else 0,
-                        current_time
-                    )
+                self.sample_q.append(('monitor', time.monotonic_ns(), position, velocity, torque,
+                                      current_a, current_b, current_c))
                 
-                time.sleep(0.1)  # 10 Hz update rate for data collection
+                self._monitor_wake.wait(0.1)  # 10 Hz update rate for data collection
                 
             except Exception as e:
-                self.log_message(f"Monitoring error: {e}")
+                self.sample_q.append(('log', f"Monitoring error: {e}"))
+                break
+                
+    def _drain_samples(self) -> None:
+        """Apply all readings queued by the polling threads, then reschedule."""
+        sample_q = self.sample_q
+        while True:
+            try:
+                sample = sample_q.popleft()
+            except IndexError:
                 break
+            self._apply_sample(sample)
+        self.root.after(_DRAIN_INTERVAL_MS, self._drain_samples)
+        
+    def _apply_sample(self, sample: tuple) -> None:
+        """Apply one queued reading to the data history, plotter and status display."""
+        kind = sample[0]
+        if kind == 'status':
+            self._queue_readouts(zip(_READOUT_FORMATS, sample[1:]))
+        elif kind == 'monitor':
+            _, timestamp, *values = sample
+            position, velocity, torque, current_a, current_b, current_c = (
+                value if value is not None else 0 for value in values)
+            
+            # Store data for plotting
+            self.data_history['time'].append(timestamp)
+            self.data_history['position'].append(position)
+            self.data_history['velocity'].append(velocity)
+            self.data_history['torque'].append(torque)
+            
+            # Send data to plotter if it exists and is plotting
+            if self.plotter and self.plotter.plotting:
+                self.plotter.add_data_point(position, velocity, torque,
+                                            current_a, current_b, current_c, timestamp)
+        elif kind == 'state':
+            _, timestamp, state = sample
+            if self.plotter and self.plotter.plotting:
+                self.plotter.add_data_point(
+                    state.position,
+                    state.velocity,
+                    state.torque,
+                    state.current_a,
+                    state.current_b,
+                    state.current_c,
+                    timestamp
+                )
                 
+                # Update status display
+                self._queue_readouts(zip(_READOUT_FORMATS, state))
+        elif kind == 'motion':
+            _, timestamp, motion = sample
+            if self.plotter and self.plotter.plotting:
+                position, velocity, torque = motion
+                self.plotter.add_data_point(position, velocity, torque, timestamp=timestamp)
+                self._queue_readouts(zip(_READOUT_FORMATS, motion))
+        elif kind == 'ports':
+            self._show_ports(sample[1])
+        elif kind == 'log':
+            self.log_message(sample[1])
+            
+    def _set_readouts(self, readouts) -> None:
+        """Show (key, value) status readouts, skipping values that were not read."""
+        readout_vars = self.readout_vars
+        for key, value in readouts:
+            if value is not None:
+                readout_vars[key].set(_READOUT_FORMATS[key] % value)
+                
+    def _queue_readouts(self, readouts) -> None:
+        """Show status readouts at the next idle point, keeping only the newest per key."""
+        pending = self._pending_readouts
+        scheduled = bool(pending)
+        pending.update((key, value) for key, value in readouts if value is not None)
+        if pending and not scheduled:
+            self.root.after_idle(self._flush_readouts)
+        
+    def _flush_readouts(self) -> None:
+        """Show the readouts queued since the last idle point."""
+        readouts = list(self._pending_readouts.items())
+        self._pending_readouts.clear()
+        self._set_readouts(readouts)
+        
     def log_message(self, message: str) -> None:
         """Add a message to the log."""
+        timestamp = time.strftime("%H:%M:%S")
+        # Written in one insert per idle point, so bursts of errors cost one re-layout
+        if not self._log_pending:
+            self.root.after_idle(self._flush_log)
+        self._log_pending.append(f"[{timestamp}] {message}\n")
+        
+    def _flush_log(self) -> None:
+        """Write pending log entries and drop the oldest lines beyond the cap."""
+        entries = self._log_pending
+        self._log_pending = []
         # Check if log_text exists (it might not be initialized yet)
-        if not hasattr(self, 'log_text'):
+        if not entries or not hasattr(self, 'log_text'):
             return
             
-        timestamp = time.strftime("%H:%M:%S")
-        log_entry = f"[{timestamp}] {message}\n"
-        self.log_text.insert(tk.END, log_entry)
+        self.log_text.insert(tk.END, "".join(entries))
+        self._log_lines += len(entries)
+        if self._log_lines > _LOG_MAX_LINES:
+            self.log_text.delete("1.0", f"{self._log_lines - _LOG_MAX_LINES + 1}.0")
+            self._log_lines = _LOG_MAX_LINES
         self.log_text.see(tk.END)
         
     def clear_log(self) -> None:
@@ -1424,6 +1609,7 @@ class ActuatorGUI:
             return
             
         self.log_text.delete(1.0, tk.END)
+        self._log_lines = 0
         
     def start_plotting(self) -> None:
         """Start real-time plotting."""
@@ -1453,49 +1639,39 @@ class ActuatorGUI:
             return
             
         self.plotting_polling = True
+        self._plotting_wake.clear()
         self.plotting_thread = threading.Thread(target=self.plotting_polling_loop, daemon=True)
         self.plotting_thread.start()
         
     def stop_plotting_polling(self) -> None:
         """Stop polling for plotting data."""
         self.plotting_polling = False
+        self._plotting_wake.set()
         if hasattr(self, 'plotting_thread') and self.plotting_thread:
             self.plotting_thread.join(timeout=1.0)
         
     def plotting_polling_loop(self) -> None:
         """Polling loop for plotting data."""
-        while self.plotting_polling and self.connected and self.actuator:
+        actuator = self.actuator
+        # The binary protocol has no full-state command; poll the pipelined
+        # position/velocity/torque exchange instead
+        binary = actuator.interface.command_mode == CommandMode.HIGH_SPEED_BINARY
+        while self.plotting_polling and self.connected:
             try:
-                # Get full state data
-                state = self.actuator.get_full_state()
-                if state is not None:
-                    # Send data to plotter
-                    if self.plotter and hasattr(self.plotter, 'plotting') and self.plotter.plotting:
-                        self.plotter.add_data_point(
-                            state['position'],
-                            state['velocity'], 
-                            state['torque'],
-                            state.get('current_a', 0),
-                            state.get('current_b', 0),
-                            state.get('current_c', 0),
-                            time.time()
-                        )
-                        
-                        # Update status display
-                        def update_status():
-                            self.position_status.config(text=f"{state['position']:.2f}°")
-                            self.velocity_status.config(text=f"{state['velocity']:.2f}°/s")
-                            self.torque_status.config(text=f"{state['torque']:.2f} Nm")
-                            self.temperature_status.config(text=f"{state['temperature']:.1f}°C")
-                            self.bus_voltage_status.config(text=f"{state['bus_voltage']:.2f} V")
-                            self.internal_temperature_status.config(text=f"{state['internal_temperature']:.1f}°C")
-                        
-                        self.root.after(0, update_status)
+                if binary:
+                    motion = actuator.poll_state()
+                    if motion is not None:
+                        self.sample_q.append(('motion', time.monotonic_ns(), motion))
+                else:
+                    # Get full state data
+                    state = actuator.get_full_state()
+                    if state is not None:
+                        self.sample_q.append(('state', time.monotonic_ns(), state))
                 
-                time.sleep(0.02)  # 50Hz polling rate
+                self._plotting_wake.wait(0.02)  # 50Hz polling rate
                 
             except Exception as e:
-                self.log_message(f"Plotting polling error: {e}")
+                self.sample_q.append(('log', f"Plotting polling error: {e}"))
                 break
         
     def stop_plotting(self) -> None:
@@ -5,16 +5,29 @@ This module provides real-time plotting capabilities for position,
 velocity, and torque data from the actuator.
 """
 
+import logging
 import tkinter as tk
 from tkinter import ttk
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
 import numpy as np
-from typing import Dict, List, Any, Optional
-import threading
+from typing import Dict, Any, Optional
 import time
 
+from .ring_buffer import RingBuffer
+
+logger = logging.getLogger(__name__)
+
+# Sampled channels kept for plotting
+_CHANNELS = ('time', 'position', 'velocity', 'torque', 'current_a', 'current_b', 'current_c')
+
+# Samples held per channel; covers the 60 s window at the 50 Hz polling rate
+_HISTORY_CAPACITY = 4096
+
+# Interval in ms between plot frames (~30 FPS), independent of the sample rate
+_FRAME_INTERVAL_MS = 33
+
 
 class ActuatorPlotter:
     """
@@ -34,37 +47,28 @@ class ActuatorPlotter:
         """
         self.parent = parent
         self.max_points = max_points
-        self.data_history: Dict[str, List[float]] = {
-            'time': [],
-            'position': [],
-            'velocity': [],
-            'torque': [],
-            'current_a': [],
-            'current_b': [],
-            'current_c': []
+        self.data_history: Dict[str, RingBuffer] = {
+            key: RingBuffer(_HISTORY_CAPACITY, np.int64 if key == 'time' else np.float64)
+            for key in _CHANNELS
         }
         self.plotting = False
-        self.plot_thread: Optional[threading.Thread] = None
+        
+        # Redraws are coalesced into one per frame tick
+        self._redraw_pending = False
+        self._tick_id: Optional[str] = None
         
         # Initialize with fixed 60-second window
         self.window_duration = 60.0  # 60 seconds
-        self.current_time = time.time()
+        self.current_time = time.monotonic_ns()
         self.initialize_fixed_window()
         
         self.setup_plot()
         
     def initialize_fixed_window(self) -> None:
         """Initialize the plotter with a fixed 60-second window."""
-        # Initialize with empty data but fixed time window
-        self.data_history = {
-            'time': [],
-            'position': [],
-            'velocity': [],
-            'torque': [],
-            'current_a': [],
-            'current_b': [],
-            'current_c': []
-        }
+        # Start with empty buffers; the time axis stays fixed
+        for buffer in self.data_history.values():
+            buffer.clear()
         
     def setup_plot(self) -> None:
         """Set up the matplotlib plot."""
@@ -123,7 +127,7 @@ class ActuatorPlotter:
         
     def add_data_point(self, position: float, velocity: float, torque: float, 
                       current_a: float = 0.0, current_b: float = 0.0, current_c: float = 0.0,
-                      timestamp: Optional[float] = None) -> None:
+                      timestamp: Optional[int] = None) -> None:
         """
         Add a new data point to the plot.
         
@@ -134,98 +138,99 @@ class ActuatorPlotter:
             current_a: Phase A current in Amperes
             current_b: Phase B current in Amperes
             current_c: Phase C current in Amperes
-            timestamp: Broadcast timestamp (if None, uses current time)
+            timestamp: Sample time from time.monotonic_ns() (if None, uses current time)
         """
         if timestamp is None:
-            timestamp = time.time()
+            timestamp = time.monotonic_ns()
         
         # Update current time reference
         self.current_time = timestamp
         
         # Add to data history
-        self.data_history['time'].append(timestamp)
-        self.data_history['position'].append(position)
-        self.data_history['velocity'].append(velocity)
-        self.data_history['torque'].append(torque)
-        self.data_history['current_a'].append(current_a)
-        self.data_history['current_b'].append(current_b)
-        self.data_history['current_c'].append(current_c)
-        
-        # Maintain fixed window - remove data older than window_duration
-        cutoff_time = timestamp - self.window_duration
-        while (self.data_history['time'] and 
-               self.data_history['time'][0] < cutoff_time):
-            for key in self.data_history:
-                self.data_history[key] = self.data_history[key][1:]
-        
-        # Don't update plot immediately - let the plot loop handle it
-        # This prevents blocking the data collection thread
+        history = self.data_history
+        history['time'].append(timestamp)
+        history['position'].append(position)
+        history['velocity'].append(velocity)
+        history['torque'].append(torque)
+        history['current_a'].append(current_a)
+        history['current_b'].append(current_b)
+        history['current_c'].append(current_c)
+        
+        # Maintain fixed window - drop data older than window_duration
+        cutoff_time = timestamp - int(self.window_duration * 1e9)
+        times = history['time']
+        while times.count and times.first() < cutoff_time:
+            for buffer in history.values():
+                buffer.popleft()
+        
+        # Don't update plot immediately - the next frame tick draws
+        # whatever is newest
+        self._redraw_pending = True
             
     def start_plotting(self) -> None:
         """Start the real-time plotting."""
         self.plotting = True
-        self.plot_thread = threading.Thread(target=self.plot_loop, daemon=True)
-        self.plot_thread.start()
+        if self._tick_id is None:
+            self._tick_id = self.parent.after(_FRAME_INTERVAL_MS, self._tick)
         
     def stop_plotting(self) -> None:
         """Stop the real-time plotting."""
         self.plotting = False
-        
-    def plot_loop(self) -> None:
-        """Main plotting loop."""
-        last_update = 0
-        update_interval = 0.02  # 50 Hz update rate for smooth plotting
-        
-        while self.plotting:
+        if self._tick_id is not None:
+            self.parent.after_cancel(self._tick_id)
+            self._tick_id = None
+        
+    def _tick(self) -> None:
+        """Frame tick: redraw if samples arrived since the last frame."""
+        if self._redraw_pending:
+            self._redraw_pending = False
             try:
-                current_time = time.time()
-                if current_time - last_update >= update_interval:
-                    self.update_plot()
-                    last_update = current_time
-                else:
-                    time.sleep(0.001)  # Small sleep to prevent excessive CPU usage
+                self.update_plot()
             except Exception as e:
-                print(f"Plotting error: {e}")
-                break
+                logger.error("Plotting error: %s", e)
+        self._tick_id = self.parent.after(_FRAME_INTERVAL_MS, self._tick)
                 
     def update_plot(self) -> None:
         """Update the plot with current data."""
-        if not self.data_history['time']:
+        history = self.data_history
+        if not history['time'].count:
             return
             
         # Convert to relative time (negative seconds from current time)
-        current_time = self.current_time
-        relative_time = [t - current_time for t in self.data_history['time']]
+        relative_time = (history['time'].values() - self.current_time) * 1e-9
             
         # Update position plot
-        self.position_line.set_data(relative_time, self.data_history['position'])
-        self.ax_position.relim()
-        self.ax_position.autoscale_view()
+        self.position_line.set_data(relative_time, history['position'].values())
+        self._scale_y(self.ax_position, 'position')
         
         # Update velocity plot
-        self.velocity_line.set_data(relative_time, self.data_history['velocity'])
-        self.ax_velocity.relim()
-        self.ax_velocity.autoscale_view()
+        self.velocity_line.set_data(relative_time, history['velocity'].values())
+        self._scale_y(self.ax_velocity, 'velocity')
         
         # Update torque plot
-        self.torque_line.set_data(relative_time, self.data_history['torque'])
-        self.ax_torque.relim()
-        self.ax_torque.autoscale_view()
+        self.torque_line.set_data(relative_time, history['torque'].values())
+        self._scale_y(self.ax_torque, 'torque')
         
         # Update current plots (all on same subplot)
-        self.current_a_line.set_data(relative_time, self.data_history['current_a'])
-        self.current_b_line.set_data(relative_time, self.data_history['current_b'])
-        self.current_c_line.set_data(relative_time, self.data_history['current_c'])
-        self.ax_currents.relim()
-        self.ax_currents.autoscale_view()
+        self.current_a_line.set_data(relative_time, history['current_a'].values())
+        self.current_b_line.set_data(relative_time, history['current_b'].values())
+        self.current_c_line.set_data(relative_time, history['current_c'].values())
+        self._scale_y(self.ax_currents, 'current_a', 'current_b', 'current_c')
         
         # Redraw canvas (use draw() for faster updates)
         self.canvas.draw()
         
+    def _scale_y(self, ax, *channels: str) -> None:
+        """Fit the y-axis to the tracked extrema of the given channels."""
+        lows, highs = zip(*(self.data_history[key].extrema() for key in channels))
+        low, high = min(lows), max(highs)
+        margin = (high - low) * 0.05 or abs(high) * 0.05 or 1.0
+        ax.set_ylim(low - margin, high + margin)
+        
     def clear_data(self) -> None:
         """Clear all data from the plot."""
-        for key in self.data_history:
-            self.data_history[key] = []
+        for buffer in self.data_history.values():
+            buffer.clear()
             
         # Reset plots
         self.position_line.set_data([], [])
@@ -324,7 +329,7 @@ class PlotWindow:
             self.plotter.save_plot(filename)
             self.status_label.config(text=f"Saved to {filename}")
             
-    def add_data_point(self, position: float, velocity: float, torque: float, timestamp: Optional[float] = None) -> None:
+    def add_data_point(self, position: float, velocity: float, torque: float, timestamp: Optional[int] = None) -> None:
         """
         Add a data point to the plot.
         
@@ -332,9 +337,9 @@ class PlotWindow:
             position: Position value in degrees
             velocity: Velocity value in degrees/second
             torque: Torque value in Newton-meters
-            timestamp: Broadcast timestamp (if None, uses current time)
+            timestamp: Sample time from time.monotonic_ns() (if None, uses current time)
         """
-        self.plotter.add_data_point(position, velocity, torque, timestamp)
+        self.plotter.add_data_point(position, velocity, torque, timestamp=timestamp)
         
     def show(self) -> None:
         """Show the plot window."""
@@ -0,0 +1,109 @@
+"""
+Fixed-capacity sample history for the GUI.
+
+Streaming telemetry into growing Python lists costs an allocation per
+sample and an O(N) rescan per redraw. A ring buffer keeps the history in a
+preallocated NumPy array and tracks its extrema as samples arrive, so the
+plot can be scaled without walking the whole history.
+"""
+
+import numpy as np
+
+
+class RingBuffer:
+    """
+    Preallocated NumPy ring buffer of one sample channel.
+
+    Once full, each append overwrites the oldest sample. The minimum and
+    maximum of the held samples are maintained incrementally and only
+    rescanned after the current extremum has been overwritten or dropped.
+    """
+
+    def __init__(self, capacity: int, dtype=np.float64):
+        """
+        Initialize ring buffer.
+
+        Args:
+            capacity: Maximum number of samples held
+            dtype: NumPy type of the samples
+        """
+        self.buf = np.empty(capacity, dtype=dtype)
+        self.head = 0
+        self.count = 0
+        self._min = np.inf
+        self._max = -np.inf
+        self._extrema_stale = False
+
+    def append(self, value) -> None:
+        """Add a sample, overwriting the oldest one if the buffer is full."""
+        buf = self.buf
+        head = self.head
+        if self.count == len(buf):
+            self._forget(buf[head])
+        else:
+            self.count += 1
+        buf[head] = value
+        self.head = (head + 1) % len(buf)
+        if value < self._min:
+            self._min = value
+        if value > self._max:
+            self._max = value
+
+    def popleft(self):
+        """
+        Drop the oldest sample.
+
+        Returns:
+            The dropped sample, or None if the buffer is empty
+        """
+        if not self.count:
+            return None
+        value = self.buf[self.head - self.count]
+        self.count -= 1
+        self._forget(value)
+        return value
+
+    def first(self):
+        """Get the oldest sample, or None if the buffer is empty."""
+        if not self.count:
+            return None
+        return self.buf[self.head - self.count]
+
+    def _forget(self, value) -> None:
+        """Note that a sample left the buffer; rescan extrema later if it was one."""
+        if value <= self._min or value >= self._max:
+            self._extrema_stale = True
+
+    def values(self) -> np.ndarray:
+        """Get a contiguous copy of the held samples, oldest first."""
+        start = self.head - self.count
+        if start >= 0:
+            return self.buf[start:self.head].copy()
+        return np.concatenate((self.buf[start:], self.buf[:self.head]))
+
+    def extrema(self):
+        """
+        Get the minimum and maximum of the held samples.
+
+        Returns:
+            Tuple of (min, max), or None if the buffer is empty
+        """
+        if not self.count:
+            return None
+        if self._extrema_stale:
+            held = self.values()
+            self._min = held.min()
+            self._max = held.max()
+            self._extrema_stale = False
+        return self._min, self._max
+
+    def clear(self) -> None:
+        """Drop all samples without reallocating."""
+        self.head = 0
+        self.count = 0
+        self._min = np.inf
+        self._max = -np.inf
+        self._extrema_stale = False
+
+    def __len__(self) -> int:
+        return self.count
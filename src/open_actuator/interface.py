@@ -1,11 +1,62 @@
+import os
+import sys
+import atexit
+import select
+import logging
+import subprocess
 import serial
 import time
 import struct
-from typing import Optional, Tuple, Dict
+import numpy as np
+from contextlib import contextmanager
+from typing import Optional, Tuple, Dict, List, Union, Callable, Iterator, NamedTuple
 from abc import ABC, abstractmethod
 from enum import IntEnum
 
 
+logger = logging.getLogger(__name__)
+
+# Precompiled binary payload formats (big-endian, as expected by the firmware)
+_Q88 = struct.Struct('>H')
+_INT16 = struct.Struct('>h')
+_FLOAT32 = struct.Struct('>f')
+_Q88_TRIPLE = struct.Struct('>3h')
+# Whole binary packets: command ID byte plus an optional 16-bit payload
+_Q88_COMMAND = struct.Struct('>BH')
+_INT16_COMMAND = struct.Struct('>Bh')
+# Largest binary command packet (one USB full-speed packet)
+_MAX_PACKET = 64
+# Receive queue requested from the Windows driver, so it keeps reads queued on the bus
+_WIN_RX_BUFFER_SIZE = 64 * 1024
+
+# q8.8 fixed point range
+_Q88_MIN = -128.0
+_Q88_MAX = 127.996
+
+# Packed layout of a binary command carrying one q8.8 value
+_Q88_PACKET = np.dtype([('command_id', 'u1'), ('value', '>i2')])
+
+
+def _q88_packets(command_id: int, values) -> bytes:
+    """
+    Build back-to-back binary packets carrying one q8.8 value each.
+    
+    Args:
+        command_id: Command ID placed in front of every value
+        values: Float values to send (any array-like)
+        
+    Returns:
+        Concatenated 3-byte packets
+    """
+    # np.clip lets NaN through, so map it to the maximum like _float_to_q88
+    values = np.nan_to_num(np.asarray(values, dtype=np.float64), nan=_Q88_MAX)
+    clamped = np.clip(values, _Q88_MIN, _Q88_MAX)
+    packets = np.empty(clamped.shape[0], dtype=_Q88_PACKET)
+    packets['command_id'] = command_id
+    packets['value'] = clamped * 256.0
+    return packets.tobytes()
+
+
 class CommandID(IntEnum):
     """Actuator command IDs."""
     SET_POSITION = 0x01
@@ -48,6 +99,153 @@ class FOCModulationType(IntEnum):
     TRAPEZOID_150 = 3
 
 
+class ActuatorState(NamedTuple):
+    """Full actuator state as reported by get_full_state."""
+    position: float
+    velocity: float
+    torque: float
+    temperature: float
+    bus_voltage: float
+    internal_temperature: float
+    current_a: float
+    current_b: float
+    current_c: float
+
+
+# udev rule applying the 1 ms latency timer to usb-serial adapters when they appear
+_UDEV_RULE_PATH = "/etc/udev/rules.d/99-open-actuator.rules"
+_UDEV_RULE = 'ACTION=="add", SUBSYSTEM=="usb-serial", DRIVER=="ftdi_sio", ATTR{latency_timer}="1"\n'
+
+
+# Binary response sizes in bytes; commands not listed reply with a 1 byte ack
+_RESPONSE_LENGTHS = {
+    CommandID.GET_POSITION: _Q88.size,
+    CommandID.GET_VELOCITY: _Q88.size,
+    CommandID.GET_TORQUE: _Q88.size,
+    CommandID.GET_CURRENT_A: _FLOAT32.size,
+    CommandID.GET_CURRENT_B: _FLOAT32.size,
+    CommandID.GET_CURRENT_C: _FLOAT32.size,
+}
+
+
+# Human-readable PID commands per control loop:
+# (get command line, get response prefix, set command template, set response prefix)
+_PID_COMMANDS = {
+    "velocity": (b"get_velocity_pid\n", "get_velocity_pid ", b"set_velocity_pid %a %a %a\n", "set_velocity_pid "),
+    "angle": (b"get_angle_pid\n", "get_angle_pid ", b"set_angle_pid %a %a %a\n", "set_angle_pid "),
+    "current": (b"get_current_pid\n", "get_current_pid ", b"set_current_pid %a %a %a\n", "set_current_pid "),
+}
+
+
+class _BufferedSerial:
+    """
+    Read-buffering wrapper around a serial port.
+    
+    pyserial's ``read_until()`` reads one byte per call, which on Windows
+    also means one ``in_waiting`` query per byte. This wrapper pulls every
+    byte that is already waiting in one read and serves lines and frames
+    from memory. All other attributes are passed through to the port.
+    """
+    
+    def __init__(self, ser: serial.Serial):
+        """
+        Initialize buffered serial wrapper.
+        
+        Args:
+            ser: Open serial port to wrap
+        """
+        self.ser = ser
+        self.buf = bytearray()
+    
+    def _fill(self) -> bool:
+        """Read all pending bytes (at least one, up to the port timeout)."""
+        pending = self.ser.in_waiting
+        if not pending:
+            # Wait for the first byte; the rest of a response arrives in the
+            # same USB packet, so pick it up in the same call
+            data = self.ser.read(1)
+            if not data:
+                return False
+            self.buf += data
+            pending = self.ser.in_waiting
+        if pending:
+            self.buf += self.ser.read(pending)
+        return True
+    
+    def _take(self, n: int) -> bytes:
+        """Remove and return the first ``n`` buffered bytes."""
+        # Copy through a view so the slice is not materialized twice
+        with memoryview(self.buf) as view:
+            data = bytes(view[:n])
+        del self.buf[:n]
+        return data
+    
+    def read_until(self, expected: bytes = b'\n') -> bytes:
+        """
+        Read up to and including ``expected``.
+        
+        Returns:
+            The line, or whatever arrived before the port timeout
+        """
+        start = 0
+        while True:
+            i = self.buf.find(expected, start)
+            if i >= 0:
+                i += len(expected)
+                break
+            start = max(0, len(self.buf) - len(expected) + 1)
+            if not self._fill():
+                i = len(self.buf)
+                break
+        return self._take(i)
+    
+    def readline(self) -> bytes:
+        """Read one newline-terminated line."""
+        return self.read_until(b'\n')
+    
+    def has_line(self) -> bool:
+        """Check, without blocking, whether a complete line has arrived."""
+        pending = self.ser.in_waiting
+        if pending:
+            self.buf += self.ser.read(pending)
+        return b'\n' in self.buf
+    
+    def readinto(self, b) -> int:
+        """
+        Fill ``b`` from buffered bytes first, then from the port.
+        
+        Returns:
+            Number of bytes written into ``b``
+        """
+        n = min(len(b), len(self.buf))
+        with memoryview(self.buf) as view:
+            b[:n] = view[:n]
+        del self.buf[:n]
+        if n < len(b):
+            with memoryview(b) as view:
+                n += self.ser.readinto(view[n:])
+        return n
+    
+    def read(self, size: int = 1) -> bytes:
+        """Read up to ``size`` bytes."""
+        if len(self.buf) < size:
+            self.buf += self.ser.read(size - len(self.buf))
+        return self._take(size)
+    
+    @property
+    def in_waiting(self) -> int:
+        """Number of bytes available without blocking."""
+        return len(self.buf) + self.ser.in_waiting
+    
+    def reset_input_buffer(self) -> None:
+        """Discard buffered and pending input."""
+        self.buf.clear()
+        self.ser.reset_input_buffer()
+    
+    def __getattr__(self, name: str):
+        return getattr(self.ser, name)
+
+
 class Interface(ABC):
     """Abstract base class for actuator interfaces."""
     
@@ -165,7 +363,9 @@ class USBInterface(Interface):
     including all control methods and extended functionality.
     """
     
-    def __init__(self, port: str, baudrate: int = 2000000, timeout: float = 1.0):
+    def __init__(self, port: str, baudrate: int = 2000000, timeout: float = 1.0,
+                 low_latency: bool = True, mode: Optional[CommandMode] = None,
+                 rx_buffer_size: int = _WIN_RX_BUFFER_SIZE):
         """
         Initialize USB interface.
         
@@ -173,14 +373,54 @@ class USBInterface(Interface):
             port: Serial port name (e.g., '/dev/ttyUSB0' or 'COM3')
             baudrate: Serial communication baud rate
             timeout: Serial communication timeout in seconds
+            low_latency: Request low-latency USB serial driver settings on connect
+            mode: Command mode to negotiate with the actuator on connect
+                (None talks in ``command_mode`` without negotiating)
+            rx_buffer_size: Receive queue requested from the serial driver
+                (Windows only; smaller favours latency, larger throughput)
         """
         self.port = port
         self.baudrate = baudrate
         self.timeout = timeout
-        self.serial_conn: Optional[serial.Serial] = None
+        self.low_latency = low_latency
+        self.mode = mode
+        self.rx_buffer_size = rx_buffer_size
+        self.serial_conn: Optional[_BufferedSerial] = None
         self.command_mode = CommandMode.HUMAN_READABLE
+        # Only set once serial_conn is open, so it is the single check commands need
         self.connected = False
 
+        # Setpoints sent without waiting for their acknowledgement
+        self.ack_window = 8
+        self._pending_acks = 0
+        # Setpoints held back by batched_commands() until the batch is written
+        self.batch_watermark = _MAX_PACKET
+        self._batch: Optional[bytearray] = None
+
+        # Reusable receive buffer for binary responses
+        self._rx = bytearray(256)
+        self._rx_view = memoryview(self._rx)
+        # The position, velocity and torque responses of poll_state, as q8.8 integers
+        self._rx_state = np.frombuffer(self._rx, dtype='>i2', count=3)
+        # Reusable transmit buffer; commands are serialized, so one is enough
+        self._tx = bytearray(_MAX_PACKET)
+        self._tx_view = memoryview(self._tx)
+        self._setpoint = self._tx_view[:_Q88_COMMAND.size]
+        # Raw port descriptor for the binary fast path (POSIX only)
+        self._fd: Optional[int] = None
+
+    @property
+    def command_mode(self) -> CommandMode:
+        """Get the active command communication mode."""
+        return self._command_mode
+
+    @command_mode.setter
+    def command_mode(self, mode: CommandMode) -> None:
+        """Set the active command mode and cache the protocol selection."""
+        self._command_mode = mode
+        # Checked by every command, so resolve the enum comparison once here
+        self._human_readable = mode == CommandMode.HUMAN_READABLE
+
     def connect(self) -> bool:
         """
         Establish connection to the actuator.
@@ -188,28 +428,105 @@ class USBInterface(Interface):
         Returns:
             True if connection successful, False otherwise
         """
+        if self.connected and self.serial_conn and self.serial_conn.is_open:
+            return True
         
         try:
-            self.serial_conn = serial.Serial(
+            self.serial_conn = _BufferedSerial(serial.Serial(
                 port=self.port,
                 baudrate=self.baudrate,
                 timeout=self.timeout
-            )
+            ))
+            if self.low_latency:
+                self._enable_low_latency()
+            if sys.platform != 'win32':
+                self._fd = self.serial_conn.fileno()
+            else:
+                # The default queue is small enough for the device to stall on bursts
+                self.serial_conn.set_buffer_size(rx_size=self.rx_buffer_size)
             time.sleep(0.1)  # Allow connection to stabilize
             self.connected = True
+            
+            if (self.mode is not None and self.mode != self.command_mode
+                    and not self.set_command_mode(self.mode)):
+                logger.warning("Failed to switch %s to %s, staying in %s",
+                               self.port, self.mode.name, self.command_mode.name)
             return True
 
         except (serial.SerialException, OSError) as e:
-            import traceback
-            traceback.print_exc()
-            print(f"Failed to connect to {self.port}: {e}")
+            logger.error("Failed to connect to %s: %s", self.port, e)
+            logger.debug("Connection failure details", exc_info=True)
             self.connected = False
             return False
 
+    def _enable_low_latency(self) -> None:
+        """
+        Reduce the USB serial driver latency for request/response traffic.
+
+        Sets ASYNC_LOW_LATENCY on the port and, for usb-serial adapters such as
+        FTDI, drops the sysfs latency timer from its 16 ms default to 1 ms.
+        Both steps are best effort: unsupported platforms, CDC-ACM devices and
+        non-root users simply keep the driver defaults. On systems where this
+        has no effect, ``setserial /dev/ttyUSB0 low_latency`` applies the same
+        setting manually.
+        """
+        try:
+            self.serial_conn.set_low_latency_mode(True)
+        except (IOError, ValueError, AttributeError, NotImplementedError):
+            pass
+
+        tty_name = os.path.basename(os.path.realpath(self.port))
+        latency_timer = f"/sys/bus/usb-serial/devices/{tty_name}/latency_timer"
+        try:
+            with open(latency_timer, "w") as f:
+                f.write("1")
+        except OSError:
+            pass
+        
+        # Non-root users cannot write the timer, so point them at the udev rule
+        try:
+            with open(latency_timer) as f:
+                latency_ms = int(f.read())
+        except (OSError, ValueError):
+            return
+        if latency_ms > 1:
+            logger.warning("%s latency timer is %d ms; run USBInterface.install_udev_rule() "
+                           "as root to set it to 1 ms permanently", self.port, latency_ms)
+
+    @staticmethod
+    def install_udev_rule(path: str = _UDEV_RULE_PATH) -> bool:
+        """
+        Install a udev rule that sets the usb-serial latency timer to 1 ms.
+        
+        The timer set by connect() is lost whenever the adapter is replugged;
+        the rule applies it every time the device appears. This is a one-time
+        setup step and needs root (e.g. ``sudo python -c "from open_actuator
+        import USBInterface; USBInterface.install_udev_rule()"``).
+        
+        Args:
+            path: Location of the rules file
+            
+        Returns:
+            True if the rule was written and udev reloaded its rules
+        """
+        try:
+            with open(path, "w") as f:
+                f.write(_UDEV_RULE)
+            subprocess.run(["udevadm", "control", "--reload-rules"], check=True)
+            subprocess.run(["udevadm", "trigger", "--subsystem-match=usb-serial"], check=True)
+            return True
+        except (OSError, subprocess.CalledProcessError) as e:
+            logger.error("Failed to install udev rule %s: %s", path, e)
+            return False
+
     def disconnect(self) -> None:
         """Disconnect from the actuator."""
         if self.serial_conn and self.serial_conn.is_open:
+            self.serial_conn.flush()  # Let any pending command reach the device
             self.serial_conn.close()
+        self._fd = None
+        self._pending_acks = 0
+        self._batch = None
         self.connected = False
 
     def _float_to_q88(self, value: float) -> int:
@@ -222,57 +539,151 @@ class USBInterface(Interface):
         Returns:
             16-bit integer in q8.8 format
         """
-        # Clamp value to valid range
-        value = max(-128.0, min(127.996, value))
+        # Clamp value to valid range (comparisons avoid the min/max call overhead);
+        # the negated test also sends NaN to the maximum, as min/max did
+        if value < _Q88_MIN:
+            value = _Q88_MIN
+        elif not value <= _Q88_MAX:
+            value = _Q88_MAX
         return int(value * 256) & 0xFFFF
     
-    def _q88_to_float(self, value: int) -> float:
+    def _send_human_command(self, command: Union[str, bytes], timeout: float = 5.0) -> Optional[str]:
         """
-        Convert q8.8 fixed point format to float.
+        Send human-readable command and get response.
         
         Args:
-            value: 16-bit integer in q8.8 format
+            command: Human-readable command string, or an already encoded
+                newline-terminated command line
+            timeout: Maximum time to wait for the response in seconds
             
         Returns:
-            Float value
+            Response string or None if failed
         """
-        # Handle signed 16-bit integer
-        if value & 0x8000:
-            value = value - 0x10000
-        return value / 256.0
+        if not self.connected:
+            return None
+        if self._pending_acks:
+            self.flush_acks()
+            
+        try:
+            if isinstance(command, str):
+                command = f"{command}\n".encode()
+            self.serial_conn.write(command)
+            return self._read_response(timeout)
+        except TimeoutError:
+            return None
+        except (serial.SerialException, UnicodeDecodeError) as e:
+            return None
     
-    def _send_human_command(self, command: str, timeout: float = 5.0) -> Optional[str]:
+    def _read_response(self, timeout: float) -> Optional[str]:
         """
-        Send human-readable command and get response.
+        Read one human-readable response line.
         
         Args:
-            command: Human-readable command string
+            timeout: Maximum time to wait for the line in seconds
             
         Returns:
-            Response string or None if failed
+            Response string or None if no complete line arrived in time
+        """
+        # Block until the newline arrives; the port timeout bounds each wait
+        deadline = time.monotonic() + timeout
+        response = b''
+        while True:
+            response += self.serial_conn.read_until(b'\n')
+            if response.endswith(b'\n'):
+                return response.decode().strip()
+            if time.monotonic() >= deadline:
+                return None
+    
+    def _send_human_commands(self, commands: List[bytes]) -> List[Optional[str]]:
         """
-        if not self.connected or not self.serial_conn:
-            return None
+        Send several human-readable commands in a single write.
+        
+        The firmware answers each command with one line, in order, so the
+        responses are collected after the whole batch has been sent.
+        
+        Args:
+            commands: Encoded newline-terminated command lines
+            
+        Returns:
+            List of response strings, None for each command without a response
+        """
+        if not self.connected:
+            return [None] * len(commands)
+        if self._pending_acks:
+            self.flush_acks()
             
         try:
-            self.serial_conn.write(f"{command}\n".encode())
-            self.serial_conn.flush()  # Ensure data is sent
+            self.serial_conn.write(b"".join(commands))
             
-            while True:
-                if self.serial_conn.in_waiting:
-
-                    response = self.serial_conn.readline().decode().strip()
-                    return response
-                time.sleep(0.1)
-                timeout -= 0.1
-                if timeout <= 0:
-                    return None
-        except TimeoutError:
-            return None
+            responses: List[Optional[str]] = []
+            for _ in commands:
+                line = self.serial_conn.read_until(b'\n')
+                responses.append(line.decode().strip() if line.endswith(b'\n') else None)
+            return responses
         except (serial.SerialException, UnicodeDecodeError) as e:
-            return None
+            return [None] * len(commands)
+
+    def _query_value(self, command: bytes, prefix: str, parse: Callable = float):
+        """
+        Send a human-readable query and parse its single-value response.
+        
+        Args:
+            command: Encoded newline-terminated command line
+            prefix: Expected response prefix, including the trailing space
+            parse: Converter applied to the value text (e.g. float or int)
+            
+        Returns:
+            Parsed value or None if failed
+        """
+        response = self._send_human_command(command)
+        if response and response.startswith(prefix):
+            try:
+                return parse(response[len(prefix):])
+            except ValueError:
+                return None
+        return None
+
+    def _read_frame(self, length: int) -> Optional[memoryview]:
+        """
+        Read a fixed-size binary response into the reusable receive buffer.
+        
+        Args:
+            length: Number of bytes to read
+            
+        Returns:
+            View of the received bytes (valid until the next read) or None on timeout
+        """
+        frame = self._rx_view[:length]
+        if self._fd is None or self.serial_conn.buf:
+            if self.serial_conn.readinto(frame) < length:
+                return None
+            return frame
+            
+        # Read straight from the descriptor, bypassing pyserial's bookkeeping
+        received = 0
+        deadline = time.monotonic() + self.timeout
+        while received < length:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not select.select([self._fd], [], [], remaining)[0]:
+                return None
+            received += os.readv(self._fd, [frame[received:]])
+        return frame
     
-    def _send_binary_command(self, command_id: int, data: bytes = b'') -> Optional[bytes]:
+    def _write(self, packet: bytes) -> None:
+        """
+        Write a packet to the port.
+        
+        Args:
+            packet: Bytes to send
+        """
+        if self._fd is None:
+            self.serial_conn.write(packet)
+            return
+        view = memoryview(packet)
+        while view:
+            view = view[os.write(self._fd, view):]
+
+    def _send_binary_command(self, command_id: int, data: bytes = b'') -> Optional[memoryview]:
         """
         Send binary command and get response.
         
@@ -281,23 +692,95 @@ class USBInterface(Interface):
             data: Optional data payload
             
         Returns:
-            Response bytes or None if failed
+            Response view (valid until the next command) or None if failed
+        """
+        # Assemble the packet in the transmit buffer instead of concatenating bytes
+        length = 1 + len(data)
+        self._tx[0] = command_id
+        self._tx[1:length] = data
+        return self._send_binary_packet(self._tx_view[:length])
+
+    def _setpoint_packet(self, command_id: int, value: float) -> memoryview:
+        """
+        Encode a q8.8 setpoint command in the transmit buffer.
+        
+        Args:
+            command_id: Command ID
+            value: Setpoint to encode
+            
+        Returns:
+            View of the packet (valid until the next command)
+        """
+        _Q88_COMMAND.pack_into(self._tx, 0, command_id, self._float_to_q88(value))
+        return self._setpoint
+
+    def _send_binary_packet(self, packet: bytes) -> Optional[memoryview]:
         """
-        if not self.connected or not self.serial_conn:
+        Send a complete binary packet and get response.
+        
+        Args:
+            packet: Command ID byte followed by the data payload
+            
+        Returns:
+            Response view (valid until the next command) or None if failed
+        """
+        if not self.connected:
             return None
+        if self._pending_acks:
+            self.flush_acks()
             
         try:
-            # Send command with data
-            packet = struct.pack('B', command_id) + data
-            self.serial_conn.write(packet)
+            self._write(packet)
             
-            # Read response (assuming single byte response for now)
-            response = self.serial_conn.read(1)
-            return response
-        except (serial.SerialException, struct.error) as e:
-            print(f"Binary communication error: {e}")
+            # Read the whole fixed-size response in one call
+            return self._read_frame(_RESPONSE_LENGTHS.get(packet[0], 1))
+        except (serial.SerialException, OSError) as e:
+            logger.error("Binary communication error: %s", e)
             return None
 
+    def _send_binary_commands(self, commands: List[Tuple[int, bytes]]) -> List[Optional[memoryview]]:
+        """
+        Send several binary commands back-to-back and collect their responses.
+        
+        All packets go out in a single write and all responses are read in a
+        single call, so a batch costs one USB round-trip instead of one per
+        command.
+        
+        Args:
+            commands: (command ID, data payload) pairs
+            
+        Returns:
+            Response views (valid until the next command), all None if the
+            batch was not answered in full
+        """
+        if not self.connected:
+            return [None] * len(commands)
+        if self._pending_acks:
+            self.flush_acks()
+            
+        lengths = [_RESPONSE_LENGTHS.get(command_id, 1) for command_id, _ in commands]
+        total = sum(lengths)
+        if total > len(self._rx):
+            self._rx = bytearray(total)
+            self._rx_view = memoryview(self._rx)
+            self._rx_state = np.frombuffer(self._rx, dtype='>i2', count=3)
+            
+        try:
+            self._write(b''.join(bytes((command_id,)) + data for command_id, data in commands))
+            frame = self._read_frame(total)
+        except (serial.SerialException, OSError) as e:
+            logger.error("Binary communication error: %s", e)
+            return [None] * len(commands)
+        if frame is None:
+            return [None] * len(commands)
+            
+        responses: List[Optional[memoryview]] = []
+        offset = 0
+        for length in lengths:
+            responses.append(frame[offset:offset + length])
+            offset += length
+        return responses
+
     def send_command(self, command: str) -> Optional[str]:
         """Send a command to the actuator."""
         return self._send_human_command(command)
@@ -309,8 +792,8 @@ class USBInterface(Interface):
         Returns:
             Current position in degrees or None if failed
         """
-        if self.command_mode == CommandMode.HUMAN_READABLE:
-            response = self._send_human_command("get_position")
+        if self._human_readable:
+            response = self._send_human_command(b"get_position\n")
             if response:
                 try:
                     # The firmware responds with "get_position <value>"
@@ -324,8 +807,7 @@ class USBInterface(Interface):
         else:
             response = self._send_binary_command(CommandID.GET_POSITION)
             if response and len(response) >= 2:
-                value = struct.unpack('>h', response[:2])[0]
-                return self._q88_to_float(value)
+                return _INT16.unpack_from(response)[0] / 256.0
         return None
 
     def get_velocity(self) -> Optional[float]:
@@ -335,8 +817,8 @@ class USBInterface(Interface):
         Returns:
             Current velocity in degrees/second or None if failed
         """
-        if self.command_mode == CommandMode.HUMAN_READABLE:
-            response = self._send_human_command("get_velocity")
+        if self._human_readable:
+            response = self._send_human_command(b"get_velocity\n")
             if response:
                 try:
                     # The firmware responds with "get_velocity <value>"
@@ -350,8 +832,7 @@ class USBInterface(Interface):
         else:
             response = self._send_binary_command(CommandID.GET_VELOCITY)
             if response and len(response) >= 2:
-                value = struct.unpack('>h', response[:2])[0]
-                return self._q88_to_float(value)
+                return _INT16.unpack_from(response)[0] / 256.0
         return None
 
     def get_torque(self) -> Optional[float]:
@@ -361,8 +842,8 @@ class USBInterface(Interface):
         Returns:
             Current torque in Nm or None if failed
         """
-        if self.command_mode == CommandMode.HUMAN_READABLE:
-            response = self._send_human_command("get_torque")
+        if self._human_readable:
+            response = self._send_human_command(b"get_torque\n")
             if response:
                 try:
                     # The firmware responds with "get_torque <value>"
@@ -376,8 +857,7 @@ class USBInterface(Interface):
         else:
             response = self._send_binary_command(CommandID.GET_TORQUE)
             if response and len(response) >= 2:
-                value = struct.unpack('>h', response[:2])[0]
-                return self._q88_to_float(value)
+                return _INT16.unpack_from(response)[0] / 256.0
         return None
 
     def set_position(self, position: float) -> bool:
@@ -390,8 +870,11 @@ class USBInterface(Interface):
         Returns:
             True if command sent successfully
         """
-        if self.command_mode == CommandMode.HUMAN_READABLE:
-            response = self._send_human_command(f"set_position {position}")
+        if self._human_readable:
+            command = b"set_position %a\n" % float(position)
+            if self._batch is not None:
+                return self._queue_command(command)
+            response = self._send_human_command(command)
             # The firmware responds with "set_position <value>"
             if response and response.startswith("set_position "):
                 try:
@@ -403,8 +886,10 @@ class USBInterface(Interface):
                     return False
             return response is not None
         else:
-            data = struct.pack('>h', self._float_to_q88(position))
-            response = self._send_binary_command(CommandID.SET_POSITION, data)
+            packet = self._setpoint_packet(CommandID.SET_POSITION, position)
+            if self._batch is not None:
+                return self._queue_command(packet)
+            response = self._send_binary_packet(packet)
             return response is not None
 
     def set_velocity(self, velocity: float) -> bool:
@@ -417,8 +902,11 @@ class USBInterface(Interface):
         Returns:
             True if command sent successfully
         """
-        if self.command_mode == CommandMode.HUMAN_READABLE:
-            response = self._send_human_command(f"set_velocity {velocity}")
+        if self._human_readable:
+            command = b"set_velocity %a\n" % float(velocity)
+            if self._batch is not None:
+                return self._queue_command(command)
+            response = self._send_human_command(command)
             # The firmware responds with "set_velocity <value>"
             if response and response.startswith("set_velocity "):
                 try:
@@ -430,8 +918,10 @@ class USBInterface(Interface):
                     return False
             return response is not None
         else:
-            data = struct.pack('>h', self._float_to_q88(velocity))
-            response = self._send_binary_command(CommandID.SET_VELOCITY, data)
+            packet = self._setpoint_packet(CommandID.SET_VELOCITY, velocity)
+            if self._batch is not None:
+                return self._queue_command(packet)
+            response = self._send_binary_packet(packet)
             return response is not None
 
     def set_torque(self, torque: float) -> bool:
@@ -444,8 +934,11 @@ class USBInterface(Interface):
         Returns:
             True if command sent successfully
         """
-        if self.command_mode == CommandMode.HUMAN_READABLE:
-            response = self._send_human_command(f"set_torque {torque}")
+        if self._human_readable:
+            command = b"set_torque %a\n" % float(torque)
+            if self._batch is not None:
+                return self._queue_command(command)
+            response = self._send_human_command(command)
             # The firmware responds with "set_torque <value>"
             if response and response.startswith("set_torque "):
                 try:
@@ -457,10 +950,226 @@ class USBInterface(Interface):
                     return False
             return response is not None
         else:
-            data = struct.pack('>h', self._float_to_q88(torque))
-            response = self._send_binary_command(CommandID.SET_TORQUE, data)
+            packet = self._setpoint_packet(CommandID.SET_TORQUE, torque)
+            if self._batch is not None:
+                return self._queue_command(packet)
+            response = self._send_binary_packet(packet)
             return response is not None
 
+    def set_position_nowait(self, position: float) -> bool:
+        """
+        Send a position setpoint without waiting for its acknowledgement.
+        
+        Up to ``ack_window`` setpoints may be in flight; beyond that the
+        oldest acknowledgement is collected first. Outstanding acks are
+        collected by flush_acks() or automatically before the next command.
+        
+        Args:
+            position: Target position in degrees
+            
+        Returns:
+            True if the setpoint was sent
+        """
+        if not self.connected:
+            return False
+        if self._human_readable:
+            packet = b"set_position %a\n" % float(position)
+        else:
+            packet = self._setpoint_packet(CommandID.SET_POSITION, position)
+        if self._batch is not None:
+            return self._queue_command(packet)
+        if self._pending_acks >= self.ack_window and not self._drain_acks(1):
+            return False
+            
+        try:
+            self._write(packet)
+        except (serial.SerialException, OSError) as e:
+            logger.error("Failed to send position setpoint: %s", e)
+            return False
+        self._pending_acks += 1
+        return True
+
+    def flush_acks(self) -> bool:
+        """
+        Collect the acknowledgements of every setpoint sent without waiting.
+        
+        Returns:
+            True if every outstanding setpoint was acknowledged
+        """
+        if not self._pending_acks:
+            return True
+        return self._drain_acks(self._pending_acks)
+
+    def _drain_acks(self, count: int) -> bool:
+        """
+        Read the acknowledgements of the oldest in-flight setpoints.
+        
+        Args:
+            count: Number of acknowledgements to read
+            
+        Returns:
+            True if all of them arrived before the port timeout
+        """
+        if self._batch and not self._write_batch():
+            self._pending_acks = 0
+            return False
+        try:
+            if self._human_readable:
+                for _ in range(count):
+                    if not self.serial_conn.read_until(b'\n').endswith(b'\n'):
+                        return self._discard_acks()
+                    self._pending_acks -= 1
+                return True
+            # Binary acks are one byte each
+            while count:
+                chunk = min(count, len(self._rx))
+                if self._read_frame(chunk) is None:
+                    return self._discard_acks()
+                count -= chunk
+                self._pending_acks -= chunk
+            return True
+        except (serial.SerialException, OSError) as e:
+            logger.error("Failed to read acknowledgements: %s", e)
+            return self._discard_acks()
+
+    def _discard_acks(self) -> bool:
+        """
+        Forget the in-flight acknowledgements after a failed read.
+        
+        Acks that did arrive may be partly consumed, so the count left in
+        the stream is unknown; the receive buffer is flushed instead so the
+        next reply is not mistaken for a stale ack.
+        
+        Returns:
+            False, for returning straight from the failed read
+        """
+        self._pending_acks = 0
+        try:
+            self.serial_conn.reset_input_buffer()
+        except (serial.SerialException, OSError):
+            pass
+        return False
+
+    @contextmanager
+    def batched_commands(self) -> Iterator[None]:
+        """
+        Coalesce setpoint commands into as few USB writes as possible.
+        
+        Inside the ``with`` block, setpoint commands append their packet to
+        a buffer and return True without waiting for the acknowledgement.
+        PID, configuration and enable/disable commands are queued the same
+        way only in human-readable mode: in binary mode enable/disable flush
+        the buffer and run synchronously, and the PID and configuration
+        setters are unsupported and return False. The buffer is written
+        whenever it reaches ``batch_watermark`` bytes, before any other
+        command, and when the block exits; the acknowledgements are then
+        collected together.
+        
+        Example:
+            with interface.batched_commands():
+                interface.set_velocity_pid(1.0, 0.1, 0.0)
+                interface.set_angle_pid(2.0, 0.0, 0.05)
+        """
+        if self._batch is not None:
+            # Nested batches join the outer one
+            yield
+            return
+        self._batch = bytearray()
+        try:
+            yield
+        finally:
+            try:
+                if not self.flush_acks():
+                    logger.warning("Not every batched command was acknowledged")
+            finally:
+                self._batch = None
+
+    def _queue_command(self, packet: bytes) -> bool:
+        """
+        Append a command to the open batch.
+        
+        Args:
+            packet: Complete command packet or line
+            
+        Returns:
+            True if the command was queued (or written at the watermark)
+        """
+        if not self.connected:
+            return False
+        # Settle the whole window so the next batch can fill it again
+        if self._pending_acks >= self.ack_window and not self.flush_acks():
+            return False
+        self._batch += packet
+        self._pending_acks += 1
+        if len(self._batch) >= self.batch_watermark:
+            return self._write_batch()
+        return True
+
+    def _write_batch(self) -> bool:
+        """
+        Write the queued batch in one USB transfer.
+        
+        Returns:
+            True if the batch was written
+        """
+        packet = bytes(self._batch)
+        self._batch.clear()
+        try:
+            self._write(packet)
+        except (serial.SerialException, OSError) as e:
+            logger.error("Failed to send batched commands: %s", e)
+            return False
+        return True
+
+    def stream_trajectory(self, positions, period: float) -> bool:
+        """
+        Stream a sequence of position setpoints at a fixed period.
+        
+        All setpoints are encoded in one NumPy operation and written without
+        waiting for each acknowledgement; the acks are drained as they arrive
+        and counted at the end. Only available in binary mode.
+        
+        Args:
+            positions: Target positions in degrees (any array-like)
+            period: Time between setpoints in seconds
+            
+        Returns:
+            True if every setpoint was acknowledged
+        """
+        if self._human_readable or not self.connected:
+            return False
+        if self._pending_acks:
+            self.flush_acks()
+            
+        packets = memoryview(_q88_packets(CommandID.SET_POSITION, positions))
+        count = len(packets) // 3
+        acks = 0
+        # Bind the per-sample calls once, outside the loop
+        write = self._write
+        serial_conn = self.serial_conn
+        monotonic = time.monotonic
+        try:
+            next_send = monotonic()
+            for offset in range(0, len(packets), 3):
+                delay = next_send - monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                write(packets[offset:offset + 3])
+                next_send += period
+                
+                # Drain acks that have already arrived so they never pile up
+                pending = serial_conn.in_waiting
+                if pending:
+                    acks += len(serial_conn.read(pending))
+                    
+            # Collect the acks still in flight
+            if acks < count:
+                acks += len(serial_conn.read(count - acks))
+        except (serial.SerialException, OSError) as e:
+            logger.error("Binary communication error: %s", e)
+            return False
+        return acks == count
+
     def enable(self) -> bool:
         """
         Enable actuator motor.
@@ -468,8 +1177,11 @@ class USBInterface(Interface):
         Returns:
             True if command sent successfully
         """
-        if self.command_mode == CommandMode.HUMAN_READABLE:
-            response = self._send_human_command("enable")
+        if self._human_readable:
+            command = b"enable\n"
+            if self._batch is not None:
+                return self._queue_command(command)
+            response = self._send_human_command(command)
             # The firmware responds with "enable" on success
             return response == "enable"
         else:
@@ -483,8 +1195,11 @@ class USBInterface(Interface):
         Returns:
             True if command sent successfully
         """
-        if self.command_mode == CommandMode.HUMAN_READABLE:
-            response = self._send_human_command("disable")
+        if self._human_readable:
+            command = b"disable\n"
+            if self._batch is not None:
+                return self._queue_command(command)
+            response = self._send_human_command(command)
             # The firmware responds with "disable" on success
             return response == "disable"
         else:
@@ -498,8 +1213,8 @@ class USBInterface(Interface):
         Returns:
             True if command sent successfully
         """
-        if self.command_mode == CommandMode.HUMAN_READABLE:
-            response = self._send_human_command("home")
+        if self._human_readable:
+            response = self._send_human_command(b"home\n")
             return response is not None
         else:
             response = self._send_binary_command(CommandID.HOME)
@@ -512,8 +1227,8 @@ class USBInterface(Interface):
         Returns:
             True if command sent successfully
         """
-        if self.command_mode == CommandMode.HUMAN_READABLE:
-            response = self._send_human_command("stop")
+        if self._human_readable:
+            response = self._send_human_command(b"stop\n")
             return response is not None
         else:
             response = self._send_binary_command(CommandID.STOP)
@@ -527,8 +1242,8 @@ class USBInterface(Interface):
         Returns:
             True if command sent successfully
         """
-        if self.command_mode == CommandMode.HUMAN_READABLE:
-            response = self._send_human_command("reset_position")
+        if self._human_readable:
+            response = self._send_human_command(b"reset_position\n")
             return response == "reset_position"
         else:
             response = self._send_binary_command(CommandID.RESET_POSITION)
@@ -544,49 +1259,64 @@ class USBInterface(Interface):
         Returns:
             True if command sent successfully
         """
-        if self.command_mode == CommandMode.HUMAN_READABLE:
-            response = self._send_human_command(f"cmd_mode {mode.value}")
+        if self._human_readable:
+            response = self._send_human_command(b"cmd_mode %d\n" % mode.value)
             if response is not None:
                 self.command_mode = mode
             return response is not None
         else:
-            data = struct.pack('>h', mode.value)
-            response = self._send_binary_command(CommandID.CMD_MODE, data)
+            _INT16_COMMAND.pack_into(self._tx, 0, CommandID.CMD_MODE, mode.value)
+            response = self._send_binary_packet(self._tx_view[:_INT16_COMMAND.size])
             if response is not None:
                 self.command_mode = mode
             return response is not None
 
+    def _parse_triple(self, prefix: str, response: Optional[str]) -> Optional[Tuple[float, float, float]]:
+        """
+        Parse a "<prefix>A B C" response into three floats.
+        
+        Args:
+            prefix: Expected response prefix, including the trailing space
+            response: Response string
+            
+        Returns:
+            Tuple of the three values or None if the response does not match
+            
+        Raises:
+            ValueError: If a value is not a valid float
+        """
+        if not response or not response.startswith(prefix):
+            return None
+        parts = response.split()
+        if len(parts) < 4:
+            return None
+        return (float(parts[1]), float(parts[2]), float(parts[3]))
 
-    def get_velocity_pid(self) -> Optional[Tuple[float, float, float]]:
+    def _get_pid(self, loop: str) -> Optional[Tuple[float, float, float]]:
         """
-        Get current velocity PID parameters.
+        Get PID parameters of a control loop.
         
+        Args:
+            loop: Control loop name ("velocity", "angle" or "current")
+            
         Returns:
             Tuple of (P, I, D) values or None if failed
         """
-        if self.command_mode == CommandMode.HUMAN_READABLE:
-            response = self._send_human_command("get_velocity_pid")
-            if response and response.startswith("get_velocity_pid "):
-                try:
-                    # Parse "get_velocity_pid P I D"
-                    parts = response.split()
-                    if len(parts) >= 4:
-                        p = float(parts[1])
-                        i = float(parts[2])
-                        d = float(parts[3])
-                        return (p, i, d)
-                except (ValueError, IndexError) as e:
-                    ...
-            return None
-        else:
+        if not self._human_readable:
             # Binary mode not implemented for PID commands yet
             return None
+        get_line, get_prefix, _, _ = _PID_COMMANDS[loop]
+        try:
+            return self._parse_triple(get_prefix, self._send_human_command(get_line))
+        except ValueError:
+            return None
 
-    def set_velocity_pid(self, p: float, i: float, d: float) -> bool:
+    def _set_pid(self, loop: str, p: float, i: float, d: float) -> bool:
         """
-        Set velocity PID parameters.
+        Set PID parameters of a control loop.
         
         Args:
+            loop: Control loop name ("velocity", "angle" or "current")
             p: Proportional gain
             i: Integral gain
             d: Derivative gain
@@ -594,23 +1324,44 @@ class USBInterface(Interface):
         Returns:
             True if command sent successfully
         """
-        if self.command_mode == CommandMode.HUMAN_READABLE:
-            response = self._send_human_command(f"set_velocity_pid {p} {i} {d}")
-            if response and response.startswith("set_velocity_pid "):
-                try:
-                    # Parse response to verify values were set
-                    parts = response.split()
-                    if len(parts) >= 4:
-                        set_p = float(parts[1])
-                        set_i = float(parts[2])
-                        set_d = float(parts[3])
-                        return True
-                except (ValueError, IndexError) as e:
-                    return False
-            return response is not None
-        else:
+        if not self._human_readable:
             # Binary mode not implemented for PID commands yet
             return False
+        _, _, set_template, set_prefix = _PID_COMMANDS[loop]
+        command = set_template % (float(p), float(i), float(d))
+        if self._batch is not None:
+            return self._queue_command(command)
+        response = self._send_human_command(command)
+        try:
+            # The firmware echoes the values that were set
+            if self._parse_triple(set_prefix, response) is not None:
+                return True
+        except ValueError:
+            return False
+        return response is not None
+
+    def get_velocity_pid(self) -> Optional[Tuple[float, float, float]]:
+        """
+        Get current velocity PID parameters.
+        
+        Returns:
+            Tuple of (P, I, D) values or None if failed
+        """
+        return self._get_pid("velocity")
+
+    def set_velocity_pid(self, p: float, i: float, d: float) -> bool:
+        """
+        Set velocity PID parameters.
+        
+        Args:
+            p: Proportional gain
+            i: Integral gain
+            d: Derivative gain
+            
+        Returns:
+            True if command sent successfully
+        """
+        return self._set_pid("velocity", p, i, d)
 
     def get_angle_pid(self) -> Optional[Tuple[float, float, float]]:
         """
@@ -619,23 +1370,7 @@ class USBInterface(Interface):
         Returns:
             Tuple of (P, I, D) values or None if failed
         """
-        if self.command_mode == CommandMode.HUMAN_READABLE:
-            response = self._send_human_command("get_angle_pid")
-            if response and response.startswith("get_angle_pid "):
-                try:
-                    # Parse "get_angle_pid P I D"
-                    parts = response.split()
-                    if len(parts) >= 4:
-                        p = float(parts[1])
-                        i = float(parts[2])
-                        d = float(parts[3])
-                        return (p, i, d)
-                except (ValueError, IndexError) as e:
-                    ...
-            return None
-        else:
-            # Binary mode not implemented for PID commands yet
-            return None
+        return self._get_pid("angle")
 
     def set_angle_pid(self, p: float, i: float, d: float) -> bool:
         """
@@ -649,23 +1384,7 @@ class USBInterface(Interface):
         Returns:
             True if command sent successfully
         """
-        if self.command_mode == CommandMode.HUMAN_READABLE:
-            response = self._send_human_command(f"set_angle_pid {p} {i} {d}")
-            if response and response.startswith("set_angle_pid "):
-                try:
-                    # Parse response to verify values were set
-                    parts = response.split()
-                    if len(parts) >= 4:
-                        set_p = float(parts[1])
-                        set_i = float(parts[2])
-                        set_d = float(parts[3])
-                        return True
-                except (ValueError, IndexError) as e:
-                    return False
-            return response is not None
-        else:
-            # Binary mode not implemented for PID commands yet
-            return False
+        return self._set_pid("angle", p, i, d)
 
     def get_current_pid(self) -> Optional[Tuple[float, float, float]]:
         """
@@ -674,23 +1393,7 @@ class USBInterface(Interface):
         Returns:
             Tuple of (P, I, D) values or None if failed
         """
-        if self.command_mode == CommandMode.HUMAN_READABLE:
-            response = self._send_human_command("get_current_pid")
-            if response and response.startswith("get_current_pid "):
-                try:
-                    # Parse "get_current_pid P I D"
-                    parts = response.split()
-                    if len(parts) >= 4:
-                        p = float(parts[1])
-                        i = float(parts[2])
-                        d = float(parts[3])
-                        return (p, i, d)
-                except (ValueError, IndexError) as e:
-                    ...
-            return None
-        else:
-            # Binary mode not implemented for PID commands yet
-            return None
+        return self._get_pid("current")
 
     def set_current_pid(self, p: float, i: float, d: float) -> bool:
         """
@@ -704,23 +1407,7 @@ class USBInterface(Interface):
         Returns:
             True if command sent successfully
         """
-        if self.command_mode == CommandMode.HUMAN_READABLE:
-            response = self._send_human_command(f"set_current_pid {p} {i} {d}")
-            if response and response.startswith("set_current_pid "):
-                try:
-                    # Parse response to verify values were set
-                    parts = response.split()
-                    if len(parts) >= 4:
-                        set_p = float(parts[1])
-                        set_i = float(parts[2])
-                        set_d = float(parts[3])
-                        return True
-                except (ValueError, IndexError) as e:
-                    return False
-            return response is not None
-        else:
-            # Binary mode not implemented for PID commands yet
-            return False
+        return self._set_pid("current", p, i, d)
 
     def save_config(self) -> bool:
         """
@@ -729,11 +1416,11 @@ class USBInterface(Interface):
         Returns:
             True if command sent successfully
         """
-        if self.command_mode == CommandMode.HUMAN_READABLE:
-            response = self._send_human_command("save_config")
+        if self._human_readable:
+            response = self._send_human_command(b"save_config\n")
             res =  response == "save_config"
             if not res:
-                print(f"[DEBUG] Save config response: '{response}'")
+                logger.debug("Save config response: '%s'", response)
             return res
         else:
             # Binary mode not implemented for save_config yet
@@ -747,15 +1434,8 @@ class USBInterface(Interface):
         Returns:
             Current downsampling value or None if failed
         """
-        if self.command_mode == CommandMode.HUMAN_READABLE:
-            response = self._send_human_command("get_downsample")
-            if response and response.startswith("get_downsample "):
-                try:
-                    value_str = response.split(" ", 1)[1]
-                    return int(value_str)
-                except (ValueError, IndexError) as e:
-                    return None
-            return None
+        if self._human_readable:
+            return self._query_value(b"get_downsample\n", "get_downsample ", int)
         else:
             # Binary mode not implemented for downsample commands yet
             return None
@@ -770,8 +1450,11 @@ class USBInterface(Interface):
         Returns:
             True if command sent successfully
         """
-        if self.command_mode == CommandMode.HUMAN_READABLE:
-            response = self._send_human_command(f"set_downsample {downsample}")
+        if self._human_readable:
+            command = b"set_downsample %d\n" % downsample
+            if self._batch is not None:
+                return self._queue_command(command)
+            response = self._send_human_command(command)
             if response and response.startswith("set_downsample "):
                 try:
                     value_str = response.split(" ", 1)[1]
@@ -791,15 +1474,8 @@ class USBInterface(Interface):
         Returns:
             Current temperature in Celsius or None if failed
         """
-        if self.command_mode == CommandMode.HUMAN_READABLE:
-            response = self._send_human_command("get_temperature")
-            if response and response.startswith("get_temperature "):
-                try:
-                    value_str = response.split(" ", 1)[1]
-                    return float(value_str)
-                except (ValueError, IndexError) as e:
-                    return None
-            return None
+        if self._human_readable:
+            return self._query_value(b"get_temperature\n", "get_temperature ", float)
         else:
             # Binary mode not implemented for temperature commands yet
             return None
@@ -811,15 +1487,8 @@ class USBInterface(Interface):
         Returns:
             Current bus voltage in Volts or None if failed
         """
-        if self.command_mode == CommandMode.HUMAN_READABLE:
-            response = self._send_human_command("get_bus_voltage")
-            if response and response.startswith("get_bus_voltage "):
-                try:
-                    value_str = response.split(" ", 1)[1]
-                    return float(value_str)
-                except (ValueError, IndexError) as e:
-                    return None
-            return None
+        if self._human_readable:
+            return self._query_value(b"get_bus_voltage\n", "get_bus_voltage ", float)
         else:
             # Binary mode not implemented for bus voltage commands yet
             return None
@@ -831,15 +1500,8 @@ class USBInterface(Interface):
         Returns:
             Current internal temperature in Celsius or None if failed
         """
-        if self.command_mode == CommandMode.HUMAN_READABLE:
-            response = self._send_human_command("get_internal_temperature")
-            if response and response.startswith("get_internal_temperature "):
-                try:
-                    value_str = response.split(" ", 1)[1]
-                    return float(value_str)
-                except (ValueError, IndexError) as e:
-                    return None
-            return None
+        if self._human_readable:
+            return self._query_value(b"get_internal_temperature\n", "get_internal_temperature ", float)
         else:
             # Binary mode not implemented for internal temperature commands yet
             return None
@@ -851,20 +1513,12 @@ class USBInterface(Interface):
         Returns:
             Current phase A current in Amperes or None if failed
         """
-        if self.command_mode == CommandMode.HUMAN_READABLE:
-            response = self._send_human_command("get_current_a")
-            if response and response.startswith("get_current_a "):
-                try:
-                    value_str = response.split(" ", 1)[1]
-                    return float(value_str)
-                except (ValueError, IndexError) as e:
-                    return None
-            return None
+        if self._human_readable:
+            return self._query_value(b"get_current_a\n", "get_current_a ", float)
         else:
             response = self._send_binary_command(CommandID.GET_CURRENT_A)
             if response and len(response) >= 4:
-                value = struct.unpack('>f', response[:4])[0]
-                return value
+                return _FLOAT32.unpack_from(response)[0]
             return None
 
     def get_current_b(self) -> Optional[float]:
@@ -874,20 +1528,12 @@ class USBInterface(Interface):
         Returns:
             Current phase B current in Amperes or None if failed
         """
-        if self.command_mode == CommandMode.HUMAN_READABLE:
-            response = self._send_human_command("get_current_b")
-            if response and response.startswith("get_current_b "):
-                try:
-                    value_str = response.split(" ", 1)[1]
-                    return float(value_str)
-                except (ValueError, IndexError) as e:
-                    return None
-            return None
+        if self._human_readable:
+            return self._query_value(b"get_current_b\n", "get_current_b ", float)
         else:
             response = self._send_binary_command(CommandID.GET_CURRENT_B)
             if response and len(response) >= 4:
-                value = struct.unpack('>f', response[:4])[0]
-                return value
+                return _FLOAT32.unpack_from(response)[0]
             return None
 
     def get_current_c(self) -> Optional[float]:
@@ -897,20 +1543,12 @@ class USBInterface(Interface):
         Returns:
             Current phase C current in Amperes or None if failed
         """
-        if self.command_mode == CommandMode.HUMAN_READABLE:
-            response = self._send_human_command("get_current_c")
-            if response and response.startswith("get_current_c "):
-                try:
-                    value_str = response.split(" ", 1)[1]
-                    return float(value_str)
-                except (ValueError, IndexError) as e:
-                    return None
-            return None
+        if self._human_readable:
+            return self._query_value(b"get_current_c\n", "get_current_c ", float)
         else:
             response = self._send_binary_command(CommandID.GET_CURRENT_C)
             if response and len(response) >= 4:
-                value = struct.unpack('>f', response[:4])[0]
-                return value
+                return _FLOAT32.unpack_from(response)[0]
             return None
 
     def recalibrate_sensors(self) -> bool:
@@ -920,14 +1558,31 @@ class USBInterface(Interface):
         Returns:
             True if command sent successfully
         """
-        if self.command_mode == CommandMode.HUMAN_READABLE:
-            response = self._send_human_command("recalibrate_sensors")
-            # The firmware responds with multiple lines during calibration
-            # We consider it successful if we get any response
-            return response is not None
-        else:
+        calibration = self.begin_recalibrate_sensors()
+        return calibration is not None and calibration.wait()
+
+    def begin_recalibrate_sensors(self) -> Optional["CalibrationHandle"]:
+        """
+        Start a sensor recalibration without waiting for it to finish.
+        
+        The actuator does not answer other commands while it calibrates, so
+        the handle must be polled or waited on before sending the next one.
+        
+        Returns:
+            Handle tracking the calibration or None if it could not be started
+        """
+        if not self._human_readable or not self.connected:
             # Binary mode not implemented for recalibrate_sensors yet
-            return False
+            return None
+        if self._pending_acks:
+            self.flush_acks()
+            
+        try:
+            self.serial_conn.write(b"recalibrate_sensors\n")
+        except (serial.SerialException, OSError) as e:
+            logger.error("Failed to start recalibration: %s", e)
+            return None
+        return CalibrationHandle(self)
 
     def get_pole_pairs(self) -> Optional[int]:
         """
@@ -936,15 +1591,8 @@ class USBInterface(Interface):
         Returns:
             Current number of pole pairs or None if failed
         """
-        if self.command_mode == CommandMode.HUMAN_READABLE:
-            response = self._send_human_command("get_pole_pairs")
-            if response and response.startswith("get_pole_pairs "):
-                try:
-                    value_str = response.split(" ", 1)[1]
-                    return int(value_str)
-                except (ValueError, IndexError) as e:
-                    return None
-            return None
+        if self._human_readable:
+            return self._query_value(b"get_pole_pairs\n", "get_pole_pairs ", int)
         else:
             # Binary mode not implemented for pole pairs commands yet
             return None
@@ -959,8 +1607,11 @@ class USBInterface(Interface):
         Returns:
             True if command sent successfully
         """
-        if self.command_mode == CommandMode.HUMAN_READABLE:
-            response = self._send_human_command(f"set_pole_pairs {pole_pairs}")
+        if self._human_readable:
+            command = b"set_pole_pairs %d\n" % pole_pairs
+            if self._batch is not None:
+                return self._queue_command(command)
+            response = self._send_human_command(command)
             if response and response.startswith("set_pole_pairs "):
                 try:
                     # Parse response to verify value was set
@@ -974,31 +1625,53 @@ class USBInterface(Interface):
             # Binary mode not implemented for pole pairs commands yet
             return False
 
-    def get_full_state(self) -> Optional[Dict[str, float]]:
+    def configure(self, pole_pairs: Optional[int] = None, min_angle: Optional[float] = None,
+                  max_angle: Optional[float] = None) -> bool:
+        """
+        Apply several configuration values in one batched exchange.
+        
+        Only the values that are given are sent.
+        
+        Args:
+            pole_pairs: Number of pole pairs (1-50)
+            min_angle: Minimum angle in degrees
+            max_angle: Maximum angle in degrees
+            
+        Returns:
+            True if every command was acknowledged
+        """
+        commands = []
+        if pole_pairs is not None:
+            commands.append(b"set_pole_pairs %d\n" % pole_pairs)
+        if min_angle is not None:
+            commands.append(b"set_min_angle %a\n" % float(min_angle))
+        if max_angle is not None:
+            commands.append(b"set_max_angle %a\n" % float(max_angle))
+        if not commands:
+            return True
+            
+        if self._human_readable:
+            responses = self._send_human_commands(commands)
+            return all(response is not None for response in responses)
+        else:
+            # Binary mode not implemented for configuration commands yet
+            return False
+
+    def get_full_state(self) -> Optional[ActuatorState]:
         """
         Get full actuator state including position, velocity, torque, and status.
         
         Returns:
-            Dictionary with state data or None if failed
+            ActuatorState with state data or None if failed
         """
-        if self.command_mode == CommandMode.HUMAN_READABLE:
-            response = self._send_human_command("get_full_state")
+        if self._human_readable:
+            response = self._send_human_command(b"get_full_state\n")
             if response and response.startswith("full_state "):
                 try:
                     # Parse "full_state pos vel torque temp voltage int_temp current_a current_b current_c"
                     parts = response.split()
                     if len(parts) >= 10:
-                        return {
-                            'position': float(parts[1]),
-                            'velocity': float(parts[2]),
-                            'torque': float(parts[3]),
-                            'temperature': float(parts[4]),
-                            'bus_voltage': float(parts[5]),
-                            'internal_temperature': float(parts[6]),
-                            'current_a': float(parts[7]),
-                            'current_b': float(parts[8]),
-                            'current_c': float(parts[9])
-                        }
+                        return ActuatorState._make(map(float, parts[1:10]))
                 except (ValueError, IndexError) as e:
                     ...
             return None
@@ -1006,6 +1679,66 @@ class USBInterface(Interface):
             # Binary mode not implemented for get_full_state yet
             return None
 
+    def poll_state(self) -> Optional[Tuple[float, float, float]]:
+        """
+        Get position, velocity and torque in a single exchange.
+        
+        In binary mode the three getters are pipelined and their q8.8
+        responses are decoded together; in human-readable mode the values
+        come from one get_full_state request.
+        
+        Returns:
+            Tuple of (position, velocity, torque) or None if failed
+        """
+        if self._human_readable:
+            state = self.get_full_state()
+            if state is None:
+                return None
+            return (state.position, state.velocity, state.torque)
+        else:
+            responses = self._send_binary_commands([
+                (CommandID.GET_POSITION, b''),
+                (CommandID.GET_VELOCITY, b''),
+                (CommandID.GET_TORQUE, b''),
+            ])
+            if responses[-1] is None:
+                return None
+            # The three 2-byte responses sit back-to-back at the start of the buffer
+            position, velocity, torque = _Q88_TRIPLE.unpack_from(self._rx_view)
+            return (position / 256.0, velocity / 256.0, torque / 256.0)
+
+    def poll_state_into(self, out: np.ndarray) -> bool:
+        """
+        Decode position, velocity and torque straight into an existing array.
+        
+        Same exchange as poll_state(), but in binary mode the responses are
+        converted from the receive buffer into ``out`` by NumPy, without
+        creating any Python floats or tuples.
+        
+        Args:
+            out: Float array of shape (3,) receiving (position, velocity, torque)
+            
+        Returns:
+            True if ``out`` was filled
+        """
+        if self._human_readable:
+            state = self.get_full_state()
+            if state is None:
+                return False
+            out[0] = state.position
+            out[1] = state.velocity
+            out[2] = state.torque
+            return True
+        responses = self._send_binary_commands([
+            (CommandID.GET_POSITION, b''),
+            (CommandID.GET_VELOCITY, b''),
+            (CommandID.GET_TORQUE, b''),
+        ])
+        if responses[-1] is None:
+            return False
+        np.divide(self._rx_state, 256.0, out=out)
+        return True
+
     def get_min_angle(self) -> Optional[float]:
         """
         Get minimum allowed angle.
@@ -1013,15 +1746,8 @@ class USBInterface(Interface):
         Returns:
             Current minimum angle in degrees or None if failed
         """
-        if self.command_mode == CommandMode.HUMAN_READABLE:
-            response = self._send_human_command("get_min_angle")
-            if response and response.startswith("get_min_angle "):
-                try:
-                    value_str = response.split(" ", 1)[1]
-                    return float(value_str)
-                except (ValueError, IndexError) as e:
-                    return None
-            return None
+        if self._human_readable:
+            return self._query_value(b"get_min_angle\n", "get_min_angle ", float)
         else:
             # Binary mode not implemented for min_angle commands yet
             return None
@@ -1036,8 +1762,11 @@ class USBInterface(Interface):
         Returns:
             True if command sent successfully
         """
-        if self.command_mode == CommandMode.HUMAN_READABLE:
-            response = self._send_human_command(f"set_min_angle {min_angle}")
+        if self._human_readable:
+            command = b"set_min_angle %a\n" % float(min_angle)
+            if self._batch is not None:
+                return self._queue_command(command)
+            response = self._send_human_command(command)
             if response and response.startswith("set_min_angle "):
                 try:
                     # Parse response to verify value was set
@@ -1058,15 +1787,8 @@ class USBInterface(Interface):
         Returns:
             Current maximum angle in degrees or None if failed
         """
-        if self.command_mode == CommandMode.HUMAN_READABLE:
-            response = self._send_human_command("get_max_angle")
-            if response and response.startswith("get_max_angle "):
-                try:
-                    value_str = response.split(" ", 1)[1]
-                    return float(value_str)
-                except (ValueError, IndexError) as e:
-                    return None
-            return None
+        if self._human_readable:
+            return self._query_value(b"get_max_angle\n", "get_max_angle ", float)
         else:
             # Binary mode not implemented for max_angle commands yet
             return None
@@ -1081,8 +1803,11 @@ class USBInterface(Interface):
         Returns:
             True if command sent successfully
         """
-        if self.command_mode == CommandMode.HUMAN_READABLE:
-            response = self._send_human_command(f"set_max_angle {max_angle}")
+        if self._human_readable:
+            command = b"set_max_angle %a\n" % float(max_angle)
+            if self._batch is not None:
+                return self._queue_command(command)
+            response = self._send_human_command(command)
             if response and response.startswith("set_max_angle "):
                 try:
                     # Parse response to verify value was set
@@ -1103,8 +1828,8 @@ class USBInterface(Interface):
         Returns:
             Current torque controller type or None if failed
         """
-        if self.command_mode == CommandMode.HUMAN_READABLE:
-            response = self._send_human_command("get_torque_controller")
+        if self._human_readable:
+            response = self._send_human_command(b"get_torque_controller\n")
             if response and response.startswith("get_torque_controller "):
                 try:
                     value_str = response.split(" ", 1)[1]
@@ -1131,8 +1856,11 @@ class USBInterface(Interface):
         Returns:
             True if command sent successfully
         """
-        if self.command_mode == CommandMode.HUMAN_READABLE:
-            response = self._send_human_command(f"set_torque_controller {controller_type.value}")
+        if self._human_readable:
+            command = b"set_torque_controller %d\n" % controller_type.value
+            if self._batch is not None:
+                return self._queue_command(command)
+            response = self._send_human_command(command)
             if response and response.startswith("set_torque_controller "):
                 try:
                     # Parse response to verify value was set
@@ -1153,8 +1881,8 @@ class USBInterface(Interface):
         Returns:
             Current FOC modulation type or None if failed
         """
-        if self.command_mode == CommandMode.HUMAN_READABLE:
-            response = self._send_human_command("get_foc_modulation")
+        if self._human_readable:
+            response = self._send_human_command(b"get_foc_modulation\n")
             if response and response.startswith("get_foc_modulation "):
                 try:
                     value_str = response.split(" ", 1)[1]
@@ -1182,8 +1910,11 @@ class USBInterface(Interface):
         Returns:
             True if command sent successfully
         """
-        if self.command_mode == CommandMode.HUMAN_READABLE:
-            response = self._send_human_command(f"set_foc_modulation {modulation_type.value}")
+        if self._human_readable:
+            command = b"set_foc_modulation %d\n" % modulation_type.value
+            if self._batch is not None:
+                return self._queue_command(command)
+            response = self._send_human_command(command)
             if response and response.startswith("set_foc_modulation "):
                 try:
                     # Parse response to verify value was set
@@ -1205,4 +1936,88 @@ class SerialInterface(Interface):
 
 class CANInterface(Interface):
     """CAN interface implementation."""
-    pass
\ No newline at end of file
+    pass
+
+
+class CalibrationHandle:
+    """
+    Tracks a sensor recalibration started with begin_recalibrate_sensors().
+    
+    The firmware reports calibration with multiple lines; as before, the
+    calibration counts as successful once the first response line arrives.
+    """
+    
+    def __init__(self, interface: USBInterface):
+        """
+        Initialize calibration handle.
+        
+        Args:
+            interface: Interface the calibration was started on
+        """
+        self._interface = interface
+        self._result: Optional[bool] = None
+    
+    def poll(self) -> Optional[bool]:
+        """
+        Check for completion without blocking.
+        
+        Returns:
+            True or False once the calibration has finished, None while it is running
+        """
+        if self._result is None:
+            try:
+                if self._interface.serial_conn.has_line():
+                    return self.wait()
+            except (serial.SerialException, OSError):
+                self._result = False
+        return self._result
+    
+    def wait(self, timeout: float = 5.0) -> bool:
+        """
+        Block until the calibration has finished.
+        
+        Args:
+            timeout: Maximum time to wait in seconds
+            
+        Returns:
+            True if the actuator reported the calibration
+        """
+        if self._result is None:
+            try:
+                self._result = self._interface._read_response(timeout) is not None
+            except (serial.SerialException, UnicodeDecodeError):
+                self._result = False
+        return self._result
+
+
+# Open USB interfaces shared across the process, keyed by (port, baudrate)
+_INTERFACES: Dict[Tuple[str, int], USBInterface] = {}
+
+
+def get_interface(port: str, baudrate: int = 2000000) -> USBInterface:
+    """
+    Get a connected USB interface, reusing an already open one for the port.
+    
+    Repeated sessions on the same port skip the port open and latency setup.
+    Shared interfaces are disconnected when the process exits.
+    
+    Args:
+        port: Serial port name (e.g., '/dev/ttyUSB0' or 'COM3')
+        baudrate: Serial communication baud rate
+        
+    Returns:
+        USB interface for the port (check ``connected`` for success)
+    """
+    key = (port, baudrate)
+    interface = _INTERFACES.get(key)
+    if interface is None:
+        interface = USBInterface(port, baudrate)
+        _INTERFACES[key] = interface
+    interface.connect()
+    return interface
+
+
+@atexit.register
+def _disconnect_interfaces() -> None:
+    for interface in _INTERFACES.values():
+        interface.disconnect()
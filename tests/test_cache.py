@@ -0,0 +1,157 @@
+"""
+Tests for the telemetry caching decorators.
+"""
+
+import threading
+import time
+
+import pytest
+
+from open_actuator import _cache
+from open_actuator._cache import cached_result, invalidates_cache, single_flight, ttl_cache
+
+
+class _CountingEvent(threading.Event):
+    """Event that counts the threads that have started waiting on it."""
+
+    def __init__(self):
+        super().__init__()
+        self.waiting = 0
+        self._count_lock = threading.Lock()
+
+    def wait(self, timeout=None):
+        with self._count_lock:
+            self.waiting += 1
+        return super().wait(timeout)
+
+
+class _Reader:
+    """Minimal object with the attributes the decorators expect."""
+
+    def __init__(self):
+        self._ttl_cache = {}
+        self._cache_generation = 0
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
+        self.reads = 0
+        self.value = 1.0
+
+    @ttl_cache(ttl_ms=20)
+    def get_value(self):
+        self.reads += 1
+        return self.value
+
+    @ttl_cache(ttl_ms=20)
+    def get_nothing(self):
+        self.reads += 1
+        return None
+
+    @ttl_cache(ttl_ms=20)
+    def get_during_command(self):
+        # A command is sent while the read is on the wire
+        self._cache_generation += 1
+        return self.value
+
+    @invalidates_cache
+    def set_value(self, value):
+        self.value = value
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake monotonic clock in nanoseconds, advanced by the test."""
+    now = [0]
+    monkeypatch.setattr(_cache.time, 'monotonic_ns', lambda: now[0])
+    return now
+
+
+def test_ttl_cache_serves_value_until_expiry(clock):
+    reader = _Reader()
+    assert reader.get_value() == 1.0
+    clock[0] += 19_000_000
+    assert reader.get_value() == 1.0
+    assert reader.reads == 1
+
+    clock[0] += 1_000_000
+    assert reader.get_value() == 1.0
+    assert reader.reads == 2
+
+
+def test_ttl_cache_does_not_keep_none(clock):
+    reader = _Reader()
+    assert reader.get_nothing() is None
+    assert reader.get_nothing() is None
+    assert reader.reads == 2
+
+
+def test_invalidates_cache_drops_cached_values(clock):
+    reader = _Reader()
+    reader.get_value()
+    reader.set_value(2.0)
+    assert cached_result(reader, 'get_value') is None
+    assert reader.get_value() == 2.0
+    assert reader.reads == 2
+
+
+def test_read_racing_a_command_is_not_cached(clock):
+    reader = _Reader()
+    assert reader.get_during_command() == 1.0
+    assert cached_result(reader, 'get_during_command') is None
+
+
+def test_cached_result_reports_only_live_entries(clock):
+    reader = _Reader()
+    assert cached_result(reader, 'get_value') is None
+    reader.get_value()
+    assert cached_result(reader, 'get_value') == 1.0
+    clock[0] += 20_000_000
+    assert cached_result(reader, 'get_value') is None
+
+
+def test_single_flight_shares_one_call_between_threads():
+    reader = _Reader()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    @single_flight
+    def slow_read(self):
+        calls.append(threading.current_thread())
+        started.set()
+        release.wait(5)
+        return 42.0
+
+    results = []
+    owner = threading.Thread(target=lambda: results.append(slow_read(reader)))
+    owner.start()
+    assert started.wait(5)
+    # Count the threads that join the in-flight call
+    call = next(iter(reader._inflight.values()))
+    call.done = _CountingEvent()
+    waiters = [threading.Thread(target=lambda: results.append(slow_read(reader)))
+               for _ in range(4)]
+    for thread in waiters:
+        thread.start()
+    deadline = time.monotonic() + 5
+    while call.done.waiting < len(waiters) and time.monotonic() < deadline:
+        time.sleep(0.001)
+    release.set()
+    for thread in [owner] + waiters:
+        thread.join(5)
+
+    assert len(calls) == 1
+    assert results == [42.0] * 5
+    assert reader._inflight == {}
+
+
+def test_single_flight_runs_again_after_completion():
+    reader = _Reader()
+    calls = []
+
+    @single_flight
+    def read(self):
+        calls.append(1)
+        return len(calls)
+
+    assert read(reader) == 1
+    assert read(reader) == 2
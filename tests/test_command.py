@@ -0,0 +1,83 @@
+"""
+Tests for Command objects and their dispatch to actuator methods.
+"""
+
+import pytest
+
+from open_actuator.actuators.Actuator import Actuator
+from open_actuator.command import (
+    Command, SetPositionCommand, SetTorqueCommand, GetPositionCommand, StopCommand,
+    GET_POSITION, STOP,
+)
+
+
+class _RecordingActuator(Actuator):
+    """Actuator that records which method each command reached."""
+
+    __slots__ = ('calls',)
+
+    def __init__(self):
+        super().__init__(None)
+        self.calls = []
+
+    def set_position(self, position: float):
+        self.calls.append(('set_position', position))
+        return True
+
+    def set_torque(self, torque: float):
+        self.calls.append(('set_torque', torque))
+        return True
+
+    def get_position(self):
+        self.calls.append(('get_position',))
+        return 1.5
+
+    def stop(self):
+        self.calls.append(('stop',))
+        return True
+
+
+def test_commands_dispatch_to_matching_methods():
+    actuator = _RecordingActuator()
+    assert actuator.send_command(SetPositionCommand(10.0))
+    assert actuator.send_command(SetTorqueCommand(0.5))
+    assert actuator.send_command(GET_POSITION) == 1.5
+    assert actuator.send_command(STOP)
+    assert actuator.calls == [
+        ('set_position', 10.0), ('set_torque', 0.5), ('get_position',), ('stop',),
+    ]
+
+
+def test_command_subclass_dispatches_through_base():
+    class RelativePositionCommand(SetPositionCommand):
+        __slots__ = ()
+
+    actuator = _RecordingActuator()
+    assert actuator.send_command(RelativePositionCommand(2.0))
+    assert actuator.calls == [('set_position', 2.0)]
+
+
+def test_unsupported_command_raises_type_error():
+    class CustomCommand(Command):
+        __slots__ = ()
+
+    with pytest.raises(TypeError, match="CustomCommand"):
+        _RecordingActuator().send_command(CustomCommand())
+
+
+def test_nullary_commands_are_shared():
+    assert GetPositionCommand() is GET_POSITION
+    assert StopCommand() is STOP
+    assert GET_POSITION.arguments == {}
+
+
+def test_arguments_come_from_slots():
+    assert SetPositionCommand(3.0).arguments == {'position': 3.0}
+
+
+def test_generic_constructor_is_deprecated():
+    with pytest.deprecated_call():
+        command = Command("set_position", position=4.0)
+    assert isinstance(command, Command)
+    assert command.command == "set_position"
+    assert command.arguments == {'position': 4.0}
@@ -0,0 +1,136 @@
+"""
+Tests for the USB interface's acknowledgement window and command batching.
+
+The serial port is replaced by an in-memory stub, so these run without
+hardware.
+"""
+
+import pytest
+
+from open_actuator.interface import USBInterface, CommandMode, _BufferedSerial
+
+
+class _StubSerial:
+    """In-memory serial port that acknowledges every command it receives."""
+
+    def __init__(self, acks: bool = True):
+        self.acks = acks
+        self.rx = bytearray()
+        self.writes = []
+        self.resets = 0
+        self.binary = False
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self.writes.append(data)
+        if self.acks:
+            # One newline-terminated echo per line, or one byte per 3-byte packet
+            count = len(data) // 3 if self.binary else data.count(b'\n')
+            self.rx += (b'\x01' if self.binary else b'ok\n') * count
+        return len(data)
+
+    @property
+    def in_waiting(self) -> int:
+        return len(self.rx)
+
+    def read(self, size: int = 1) -> bytes:
+        data = bytes(self.rx[:size])
+        del self.rx[:size]
+        return data
+
+    def readinto(self, b) -> int:
+        data = self.read(len(b))
+        b[:len(data)] = data
+        return len(data)
+
+    def reset_input_buffer(self) -> None:
+        self.resets += 1
+        self.rx.clear()
+
+
+def _interface(stub: _StubSerial, mode: CommandMode = CommandMode.HUMAN_READABLE) -> USBInterface:
+    """Build a connected interface talking to ``stub``."""
+    interface = USBInterface("stub")
+    interface.serial_conn = _BufferedSerial(stub)
+    interface.command_mode = mode
+    interface.connected = True
+    stub.binary = mode != CommandMode.HUMAN_READABLE
+    return interface
+
+
+@pytest.mark.parametrize("mode", [CommandMode.HUMAN_READABLE, CommandMode.HIGH_SPEED_BINARY])
+def test_ack_window_bounds_in_flight_setpoints(mode):
+    stub = _StubSerial()
+    interface = _interface(stub, mode)
+    interface.ack_window = 3
+
+    for i in range(10):
+        assert interface.set_position_nowait(i / 10)
+        assert 1 <= interface._pending_acks <= 3
+
+    assert len(stub.writes) == 10
+    assert interface.flush_acks()
+    assert interface._pending_acks == 0
+    assert not stub.rx
+
+
+def test_flush_acks_without_pending_acks_reads_nothing():
+    stub = _StubSerial()
+    interface = _interface(stub)
+    stub.rx += b"unrelated\n"
+    assert interface.flush_acks()
+    assert stub.rx == bytearray(b"unrelated\n")
+
+
+def test_missing_acks_reset_the_window():
+    stub = _StubSerial(acks=False)
+    interface = _interface(stub)
+    interface.timeout = 0.01
+    assert interface.set_position_nowait(1.0)
+    assert interface.set_position_nowait(2.0)
+    # Only one of the two acks arrives
+    stub.rx += b"ok\n"
+
+    assert not interface.flush_acks()
+    assert interface._pending_acks == 0
+    assert stub.resets == 1
+
+
+def test_full_window_blocks_on_failed_drain():
+    stub = _StubSerial(acks=False)
+    interface = _interface(stub)
+    interface.ack_window = 1
+    assert interface.set_position_nowait(1.0)
+    assert not interface.set_position_nowait(2.0)
+    assert len(stub.writes) == 1
+    assert interface._pending_acks == 0
+
+
+def test_batched_setpoints_share_one_write():
+    stub = _StubSerial()
+    interface = _interface(stub, CommandMode.HIGH_SPEED_BINARY)
+    with interface.batched_commands():
+        for i in range(5):
+            assert interface.set_position_nowait(i / 10)
+        assert not stub.writes
+        assert interface._pending_acks == 5
+
+    assert len(stub.writes) == 1
+    assert len(stub.writes[0]) == 5 * 3
+    assert interface._pending_acks == 0
+    assert interface._batch is None
+
+
+def test_batch_is_written_at_the_watermark():
+    stub = _StubSerial()
+    interface = _interface(stub, CommandMode.HIGH_SPEED_BINARY)
+    interface.batch_watermark = 6
+    with interface.batched_commands():
+        interface.set_position_nowait(0.1)
+        assert not stub.writes
+        interface.set_position_nowait(0.2)
+        assert len(stub.writes) == 1
+        interface.set_position_nowait(0.3)
+
+    assert [len(data) for data in stub.writes] == [6, 3]
+    assert interface._pending_acks == 0
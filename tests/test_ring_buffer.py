@@ -0,0 +1,56 @@
+"""
+Tests for the GUI sample ring buffer.
+"""
+
+import numpy as np
+
+from open_actuator.gui.ring_buffer import RingBuffer
+
+
+def test_empty_buffer():
+    buffer = RingBuffer(4)
+    assert len(buffer) == 0
+    assert buffer.first() is None
+    assert buffer.popleft() is None
+    assert buffer.extrema() is None
+    assert buffer.values().size == 0
+
+
+def test_append_wraps_and_keeps_order():
+    buffer = RingBuffer(3)
+    for value in (1.0, 2.0, 3.0, 4.0, 5.0):
+        buffer.append(value)
+    assert len(buffer) == 3
+    assert buffer.first() == 3.0
+    np.testing.assert_array_equal(buffer.values(), [3.0, 4.0, 5.0])
+
+
+def test_extrema_follow_overwritten_samples():
+    buffer = RingBuffer(3)
+    for value in (9.0, -9.0, 1.0):
+        buffer.append(value)
+    assert buffer.extrema() == (-9.0, 9.0)
+    # Overwrite the maximum, then the minimum
+    buffer.append(2.0)
+    assert buffer.extrema() == (-9.0, 2.0)
+    buffer.append(0.0)
+    assert buffer.extrema() == (0.0, 2.0)
+
+
+def test_popleft_drops_oldest_and_updates_extrema():
+    buffer = RingBuffer(4)
+    for value in (5.0, 1.0, 3.0):
+        buffer.append(value)
+    assert buffer.popleft() == 5.0
+    assert buffer.extrema() == (1.0, 3.0)
+    np.testing.assert_array_equal(buffer.values(), [1.0, 3.0])
+
+
+def test_clear_keeps_capacity():
+    buffer = RingBuffer(2)
+    buffer.append(1.0)
+    storage = buffer.buf
+    buffer.clear()
+    assert len(buffer) == 0
+    assert buffer.extrema() is None
+    assert buffer.buf is storage